@@ -0,0 +1,117 @@
+"""
+Benchmark suite for the simulator, run from the repository root:
+
+    python -m benchmarks.run                        # 12, 24 and 100 players + micro benchmarks
+    python -m benchmarks.run --sizes 1000 10000     # bigger games in a generated arena, bounded by --budget seconds
+    python -m benchmarks.run -o new.json --compare old.json
+
+Results are written as JSON (with the current commit) so two runs can be compared.
+A game the budget stops, even in the middle of a phase, is listed under cut_off with the phase it was in.
+When numpy is installed, games are also played with the vectorized scoring engine.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict
+
+from benchmarks.suite import bench_games, micro_benchmarks, np
+
+DEFAULT_SIZES = [12, 24, 100]
+ALL_SIZES = [12, 24, 100, 1000, 10000]
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def run_suite(
+        sizes, games: int, budget: float, repeat: int, micro_size: int, narrated_up_to: int
+) -> Dict[str, dict]:
+    results = {}
+    for size in sizes:
+        print(f'games with {size} players...', file=sys.stderr)
+        results[f'games/headless/{size}'] = bench_games(size, games, budget, headless=True)
+        if size <= narrated_up_to:
+            results[f'games/narrated/{size}'] = bench_games(size, games, budget, headless=False)
+        if np is not None:
+            results[f'games/vectorized/{size}'] = bench_games(size, games, budget, vectorized=True)
+    print(f'micro benchmarks with {micro_size} players...', file=sys.stderr)
+    results.update(micro_benchmarks(micro_size, repeat))
+    return results
+
+
+def headline(result: dict):
+    # the single number compared between runs: games per second, else the mean call time
+    if 'games_per_second' in result:
+        if result['games_per_second']:
+            return result['games_per_second'], 'games/s'
+        if result['seconds_per_phase']:
+            return result['seconds_per_phase'], 's/phase'
+        return None, 'cut off'  # not even one phase within the budget
+    return result['mean'], 's'
+
+
+def print_report(results: Dict[str, dict], baseline: Dict[str, dict]=None):
+    for name, result in results.items():
+        value, unit = headline(result)
+        shown = f'{value:.6g}' if value is not None else '-'
+        line = f'{name:<32} {shown:>12} {unit:<8}'
+        if baseline is not None and name in baseline and value is not None:
+            old_value, old_unit = headline(baseline[name])
+            if old_unit == unit and old_value:
+                # > 1 means faster than the baseline
+                speedup = value / old_value if unit == 'games/s' else old_value / value
+                line += f' x{speedup:.2f} vs {old_value:.6g}'
+        print(line)
+        if result.get('errors'):
+            print(f'    {result["errors"]} of {result["games"]} games crashed:')
+            for error, count in result['error_kinds'].items():
+                print(f'    {count:>4} x {error}')
+        for cut in result.get('cut_off', []):
+            print(f'    cut off by the budget on day {cut["day"]}, {cut["seconds"]:.3g} s into the {cut["phase"]} phase')
+        if 'phase_seconds' in result:
+            for phase, seconds in result['phase_seconds'].items():
+                print(f'    {phase:<28} {seconds:>12.6g} s')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='ThirstGames benchmark suite')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='roster sizes to play')
+    parser.add_argument('--all', action='store_true', help=f'play every size in {ALL_SIZES}')
+    parser.add_argument('--games', type=int, default=5, help='games played per size')
+    parser.add_argument('--budget', type=float, default=60, help='seconds allowed per size before stopping')
+    parser.add_argument('--repeat', type=int, default=20, help='calls per micro benchmark')
+    parser.add_argument('--micro-size', type=int, default=24, help='roster size used by micro benchmarks')
+    parser.add_argument('--narrated-up-to', type=int, default=24, help='also play narrated games up to this size')
+    parser.add_argument('-o', '--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare with')
+    args = parser.parse_args(argv)
+
+    sizes = ALL_SIZES if args.all else args.sizes
+    results = run_suite(sizes, args.games, args.budget, args.repeat, args.micro_size, args.narrated_up_to)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+    print_report(results, baseline)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'commit': current_commit(),
+                'date': datetime.now().isoformat(timespec='seconds'),
+                'python': platform.python_version(),
+                'args': vars(args),
+                'results': results,
+            }, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+import io
+from time import perf_counter
+from typing import Callable, Dict, List, Optional
+
+from thirst_games.arena import ArenaGenerator
+from thirst_games.constants import MORNING, START_AREA
+from thirst_games.event import AcidGas
+from thirst_games.game import Game
+from thirst_games.player.fight import do_a_fight
+from thirst_games.player.player import Player
+from thirst_games.player.scoring import np
+from thirst_games.world import World
+
+
+# from this size on, games are played in a generated arena instead of the legacy one
+GENERATED_ARENA_FROM = 1000
+# and relationships are stored sparsely, the dense store holding size² floats
+SPARSE_RELATIONSHIPS_FROM = 1000
+
+
+def make_roster(size: int) -> List[Player]:
+    return [Player(f'P{i}', i // 2 + 1, 'he' if i % 2 else 'she') for i in range(size)]
+
+
+def make_game(size: int, seed: int, headless=True, game_class=Game, vectorized=False, **kwargs) -> Game:
+    if size >= GENERATED_ARENA_FROM:
+        kwargs.setdefault('arena', ArenaGenerator())
+    if size >= SPARSE_RELATIONSHIPS_FROM:
+        kwargs.setdefault('sparse_relationships', True)
+    # a narrated game tells its story to a buffer, to time the narration without the terminal
+    world = World(seed, headless=headless, vectorized=vectorized, output=io.StringIO())
+    return game_class(make_roster(size), world, **kwargs)
+
+
+def scattered_game(size: int, seed: int, headless=True, vectorized=False) -> Game:
+    # a morning right after the bloodbath: everyone has left the cornucopia for a random area
+    game = make_game(size, seed, headless=headless, vectorized=vectorized)
+    areas = [a for a in game.map.areas if a.name != START_AREA]
+    for p in game.players:
+        game.map.move_player(p, game.rng.choice(areas))
+    game.day = 1
+    game.time = MORNING
+    return game
+
+
+class OutOfBudget(Exception):
+    pass
+
+
+class TimedGame(Game):
+    # stops with OutOfBudget once the deadline is passed, between two thinkers or actors of a phase
+    def __init__(self, *args, deadline: float=None, **kwargs):
+        Game.__init__(self, *args, **kwargs)
+        self.deadline = deadline
+        self.phase_times: List[tuple] = []
+        self.partial_phase: Optional[tuple] = None  # the phase the deadline cut and the time spent in it
+
+    def _check_deadline(self):
+        if self.deadline is not None and perf_counter() > self.deadline:
+            raise OutOfBudget
+
+    def play(self):
+        self._check_deadline()
+        start = perf_counter()
+        try:
+            Game.play(self)
+        except OutOfBudget:
+            self.partial_phase = (self.time, perf_counter() - start)
+            raise
+        self.phase_times.append((self.time, perf_counter() - start))
+
+    def _think(self, entity):
+        self._check_deadline()
+        Game._think(self, entity)
+
+    def _act(self, entity):
+        self._check_deadline()
+        Game._act(self, entity)
+
+
+def bench_games(size: int, games: int, budget: float, headless=True, seed=0, vectorized=False) -> dict:
+    # plays up to `games` full games, stopping early once `budget` seconds are spent, even in the middle of a phase
+    deadline = perf_counter() + budget
+    init_times = []
+    run_times = []
+    phase_times: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}  # repr of the exception -> games it ended
+    cut_off = []  # where the games stopped by the budget were: day, phase and seconds spent in it
+    finished = 0
+    finished_time = 0.0  # init and run time of the finished games only
+    stat_reads = [0, 0]
+    for i in range(games):
+        start = perf_counter()
+        game = make_game(
+            size, seed + i, headless=headless, game_class=TimedGame, deadline=deadline, vectorized=vectorized)
+        init_times.append(perf_counter() - start)
+        start = perf_counter()
+        try:
+            game.run()
+            finished += 1
+            finished_time += init_times[-1] + perf_counter() - start
+        except OutOfBudget:
+            seconds = game.partial_phase[1] if game.partial_phase is not None else 0
+            cut_off.append({'day': game.day, 'phase': game.time, 'seconds': seconds})
+        except Exception as e:
+            # a crashed game is not a fast game: it is counted apart from the throughput
+            errors[repr(e)] = errors.get(repr(e), 0) + 1
+        run_times.append(perf_counter() - start)
+        for phase, duration in game.phase_times:
+            phase_times.setdefault(phase, []).append(duration)
+        stat_reads[0] += game.context.stat_hits
+        stat_reads[1] += game.context.stat_misses
+        if perf_counter() > deadline:
+            break
+    phases = sum(len(t) for t in phase_times.values())
+    return {
+        'games': len(run_times),
+        'finished': finished,
+        'errors': sum(errors.values()),
+        'error_kinds': errors,
+        'cut_off': cut_off,
+        'games_per_second': finished / finished_time if finished else None,
+        'init_seconds': sum(init_times) / len(init_times),
+        'phases': phases,
+        'seconds_per_phase': sum(sum(t) for t in phase_times.values()) / phases if phases else None,
+        'phase_seconds': {phase: sum(t) / len(t) for phase, t in phase_times.items()},
+        # share of derived stat reads (courage, dangerosity...) served from the memo
+        'stat_hit_rate': stat_reads[0] / sum(stat_reads) if sum(stat_reads) else None,
+    }
+
+
+def _time(run: Callable, repeat: int, setup: Optional[Callable]=None) -> dict:
+    # best and mean time of `repeat` calls, setup (if any) runs untimed before each call
+    times = []
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        start = perf_counter()
+        run(arg)
+        times.append(perf_counter() - start)
+    return {'repeat': repeat, 'best': min(times), 'mean': sum(times) / len(times)}
+
+
+def bench_judge_strats(size: int, repeat: int) -> dict:
+    game = scattered_game(size, 0)
+
+    def run(_):
+        game.context.new_day()  # every call judges a new phase, as Game.launch does
+        for p in game.players:
+            p.judge_strats()
+    result = _time(run, repeat)
+    # strategy objects allocated in a phase: one shared catalog, where each thinker used to build its own
+    result['strategies_built'] = sum(len(c) for c in game.context.strategy_catalogs.values())
+    return result
+
+
+def bench_scoring(size: int, repeat: int) -> dict:
+    # the same decisions as bench_judge_strats, taken by the vectorized engine
+    game = scattered_game(size, 0, vectorized=True)
+    entities = [e for area in game.map.areas for e in game.playing_entities_at(area)]
+
+    def run(_):
+        game.context.new_day()
+        game.world.policy.prepare(entities)
+    return _time(run, repeat)
+
+
+def bench_consider_betrayal(size: int, repeat: int) -> dict:
+    game = scattered_game(size, 0)
+
+    def run(_):
+        for p in game.players:
+            p.consider_betrayal()
+    return _time(run, repeat)
+
+
+def bench_fight(size: int, repeat: int) -> dict:
+    seeds = iter(range(repeat))
+
+    def setup():
+        game = scattered_game(size, next(seeds))
+        return game.players[0].players, game.players[1].players
+
+    def run(teams):
+        do_a_fight(*teams)
+    return _time(run, repeat, setup)
+
+
+def bench_potential_players(size: int, repeat: int) -> dict:
+    game = scattered_game(size, 0)
+
+    def run(_):
+        for area in game.map.areas:
+            game.map.potential_players(area)
+    return _time(run, repeat)
+
+
+def bench_narrator_tell(sentences: int, repeat: int) -> dict:
+    def setup():
+        game = scattered_game(24, 0, headless=False)
+        for i in range(sentences):
+            p = game.players[i % len(game.players)]
+            game.narrator.new([p.name, 'picks up', 'a knife', p.current_area.at])
+            game.narrator.add([p.name, 'kills', 'P0', p.current_area.at, 'with his knife'])
+        return game.narrator
+
+    def run(narrator):
+        narrator.tell()
+    return _time(run, repeat, setup)
+
+
+def bench_damage_event(size: int, repeat: int) -> dict:
+    game = scattered_game(size, 0)
+
+    def run(_):
+        AcidGas(game.world)
+    return _time(run, repeat)
+
+
+def micro_benchmarks(size: int, repeat: int) -> Dict[str, dict]:
+    results = {
+        f'judge_strats/{size}': bench_judge_strats(size, repeat),
+        f'consider_betrayal/{size}': bench_consider_betrayal(size, repeat),
+        f'do_a_fight/{size}': bench_fight(size, repeat),
+        f'potential_players/{size}': bench_potential_players(size, repeat),
+        f'narrator_tell/{size * 10}': bench_narrator_tell(size * 10, repeat),
+        f'damage_event/{size}': bench_damage_event(size, repeat),
+    }
+    if np is not None:
+        results[f'scoring/{size}'] = bench_scoring(size, repeat)
+    return results
@@ -0,0 +1,89 @@
+from thirst_games.alliances import Alliances
+from thirst_games.game import Game
+from thirst_games.player.player import Player
+from thirst_games.world import World
+
+
+def test_players_start_alone():
+    alliances = Alliances()
+    assert alliances.size('a') == 1
+    assert alliances.allied('a', 'a')
+    assert not alliances.allied('a', 'b')
+
+
+def test_join_merges_whole_alliances():
+    alliances = Alliances()
+    alliances.join('a', 'b')
+    alliances.join('c', 'd', 'e')
+    alliances.join('b', 'e')
+    assert all(alliances.allied('a', p) for p in 'bcde')
+    assert alliances.size('c') == 5
+    assert alliances.all_allied('abcde')
+    assert not alliances.all_allied('abcdef')
+
+
+def test_leave_keeps_the_others_together():
+    alliances = Alliances()
+    alliances.join('a', 'b', 'c')
+    alliances.leave('b')
+    assert alliances.allied('a', 'c')
+    assert not alliances.allied('a', 'b')
+    assert alliances.size('b') == 1
+    assert alliances.size('a') == 2
+
+
+def test_split_allies_the_leavers_together():
+    alliances = Alliances()
+    alliances.join('a', 'b', 'c', 'd')
+    alliances.split(['c', 'd'])
+    assert alliances.groups('abcd') == [['a', 'b'], ['c', 'd']]
+
+
+def test_remove_drops_the_player():
+    alliances = Alliances()
+    alliances.join('a', 'b')
+    alliances.remove('b')
+    assert alliances.size('a') == 1
+    alliances.remove('b')  # removing twice is harmless
+
+
+def test_groups_in_order_of_first_appearance():
+    alliances = Alliances()
+    alliances.join('c', 'a')
+    assert alliances.groups('abcd') == [['a', 'c'], ['b'], ['d']]
+
+
+def test_stamp_changes_with_the_members_only():
+    alliances = Alliances()
+    alliances.join('a', 'b')
+    stamp = alliances.stamp('a')
+    assert alliances.stamp('b') == stamp
+    alliances.join('a', 'b')
+    alliances.join('c', 'd')
+    assert alliances.stamp('a') == stamp
+    alliances.join('a', 'c')
+    assert alliances.stamp('a') != stamp
+    stamp = alliances.stamp('a')
+    alliances.leave('d')
+    assert alliances.stamp('a') != stamp
+
+
+class Stranger:
+    # stands in the area without being anyone's ally: grouping must not look at it
+    def __getattr__(self, name):
+        raise AssertionError(f'a stranger was asked for {name}')
+
+    def __eq__(self, other):
+        raise AssertionError('a stranger was compared')
+
+
+def test_grouping_only_looks_at_the_alliance():
+    game = Game([Player(f'P{i}', i // 2 + 1, 'he') for i in range(6)], World(0, headless=True))
+    a, b, c, d = game.players[:4]
+    game.world.alliances.join(a, d, c)
+    a.current_area.players.extend(Stranger() for _ in range(1000))
+    assert a.present_allies() == [c, d]  # in the order of the area
+    assert a.current_group() == [c, d, a]
+    assert b.current_group() == [b]
+    game.map.move_player(c, game.map.areas[0])
+    assert a.present_allies() == [d]
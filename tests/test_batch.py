@@ -0,0 +1,20 @@
+from thirst_games.batch import run_game, run_many
+
+ROSTERS = [
+    [(f'P{i}', i // 2 + 1, 'he' if i % 2 else 'she') for i in range(12)],
+    [(f'Q{i}', i // 2 + 1, 'she' if i % 2 else 'he') for i in range(8)],
+]
+
+
+def test_a_pool_plays_the_same_games_as_one_worker():
+    alone = run_many(ROSTERS, 3, workers=1, seed=5)
+    pooled = run_many(ROSTERS, 3, workers=2, seed=5)
+    assert pooled == alone
+    assert [(r['roster'], r['game']) for r in alone] == [(r, g) for r in range(2) for g in range(3)]
+    assert len({r['seed'] for r in alone}) == 6
+
+
+def test_a_game_replays_from_its_seed():
+    result = run_many(ROSTERS, 1, workers=1, seed=5)[0]
+    again = run_game(ROSTERS[0], result['seed'])
+    assert again == {k: v for k, v in result.items() if k not in ('roster', 'game')}
@@ -0,0 +1,17 @@
+from benchmarks.suite import bench_games
+
+
+def test_finished_games_are_timed():
+    result = bench_games(12, 2, budget=60)
+    assert result['finished'] + result['errors'] == 2
+    assert result['cut_off'] == []
+    assert result['phases'] > 0
+
+
+def test_the_budget_cuts_a_phase_short():
+    result = bench_games(100, 3, budget=0.05)
+    assert result['games'] == 1 and result['finished'] == 0
+    assert result['games_per_second'] is None
+    [cut] = result['cut_off']
+    assert cut['day'] == 1 and cut['phase'] == 'starter'
+    assert cut['seconds'] < 1
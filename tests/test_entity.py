@@ -0,0 +1,62 @@
+import pytest
+
+from thirst_games.abstract.items import Weapon
+from thirst_games.constants import LEG_WOUND, SWORD
+from thirst_games.game import Game
+from thirst_games.player.player import Player
+from thirst_games.world import World
+
+
+@pytest.fixture
+def player():
+    game = Game([Player(f'P{i}', i // 2 + 1, 'he') for i in range(4)], World(0, headless=True))
+    return game.players[0]
+
+
+def fresh(player, stat):
+    # the stat computed again from scratch
+    player._stats.clear()
+    return getattr(player, stat)
+
+
+def test_stats_are_memoized(player):
+    assert player.dangerosity == player.dangerosity
+    assert 'dangerosity' in player._stats
+
+
+def test_health_refreshes_the_stats(player):
+    dangerosity, courage = player.dangerosity, player.courage
+    player.add_health(-0.5)
+    assert player.dangerosity < dangerosity
+    assert player.courage < courage
+    assert player.dangerosity == fresh(player, 'dangerosity')
+
+
+def test_equipment_refreshes_the_stats(player):
+    dangerosity = player.dangerosity
+    player.get_weapon(Weapon(SWORD, 3))
+    assert player.dangerosity > dangerosity
+    assert player.dangerosity == fresh(player, 'dangerosity')
+
+
+def test_loot_in_sight_refreshes_the_stats(player):
+    courage = player.courage
+    player.map.add_loot(Weapon(SWORD, 3), player.current_area)
+    assert player.courage > courage
+    assert player.courage == fresh(player, 'courage')
+
+
+def test_status_refreshes_the_stats(player):
+    move_cost, wounds = player.move_cost, player.wounds
+    player.status.append(LEG_WOUND)
+    assert player.move_cost > move_cost
+    assert player.wounds == (*wounds, LEG_WOUND)
+
+
+def test_moving_refreshes_the_stats(player):
+    courage = player.courage
+    area = player.map.areas[0]
+    area.loot.clear()
+    player.map.move_player(player, area)
+    assert player.courage == fresh(player, 'courage')
+    assert player.courage != courage
@@ -0,0 +1,50 @@
+from random import Random
+from types import SimpleNamespace
+
+import pytest
+
+from thirst_games.abstract.entity import Entity
+from thirst_games.constants import START_AREA
+from thirst_games.map import Map
+
+
+@pytest.fixture
+def arena():
+    arena = Map(Random(0), 0, arena=SimpleNamespace(build=lambda arena, player_amount: None))
+    for name in ['forest', 'river', 'forest']:
+        arena.add_area(name)
+    return arena
+
+
+def test_areas_by_index(arena):
+    assert [arena.get_area(i) for i in range(3)] == arena.areas
+    assert arena.get_area(2).full_name == 'forest[1]'
+
+
+def test_areas_by_name_and_full_name(arena):
+    first, river, second = arena.areas
+    assert arena.get_area('forest') is first
+    assert arena.get_area('forest[0]') is first
+    assert arena.get_area('forest[1]') is second
+    assert arena.get_area('river') is river
+    assert arena.areas_named('forest') == [first, second]
+    assert arena.areas_named('hill') == []
+
+
+def test_areas_of_areas_and_entities(arena):
+    area = arena.areas[1]
+    assert arena.get_area(area) is area
+    entity = Entity('rock')
+    entity.move_to(area)
+    assert arena.get_area(entity) is area
+
+
+@pytest.mark.parametrize('key', [3, -1, 'hill', 'forest[2]', START_AREA])
+def test_unknown_areas(arena, key):
+    with pytest.raises(IndexError):
+        arena.get_area(key)
+
+
+def test_other_keys(arena):
+    with pytest.raises(ValueError):
+        arena.get_area(1.5)
@@ -0,0 +1,91 @@
+import io
+from random import Random
+
+import pytest
+
+from thirst_games.narrator import EVERY_DAY, EVERY_LINE, EVERY_PHASE, Narrator, _format_names, format_list
+
+
+def test_format_list():
+    assert format_list([]) == ''
+    assert format_list(['knife']) == 'knife'
+    assert format_list(['rope', 'knife']) == 'knife and rope'
+    assert format_list(['iodine', 'rope', 'iodine', 'knife']) == '2 iodines, knife and rope'
+    assert format_list(['bandages', 'bandages']) == '2 bandages'
+
+
+def test_format_list_accepts_anything_printable():
+    assert format_list([1, 2]) == '1 and 2'
+
+
+def test_repeated_lists_are_served_from_the_cache():
+    _format_names.cache_clear()
+    assert format_list(['wire', 'net']) == format_list(['wire', 'net']) == 'net and wire'
+    info = _format_names.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def narrator(flush_every=EVERY_LINE):
+    return Narrator(Random(0), sink=io.StringIO(), flush_every=flush_every)
+
+
+def test_told_lines_keep_their_order():
+    n = narrator()
+    for i in range(5):
+        n.new([f'P{i}', 'hides'])
+    n.tell()
+    assert n.sink.getvalue() == ''.join(f'P{i} hides.\n' for i in range(5))
+    assert not n.text
+
+
+@pytest.mark.parametrize('flush_every', [EVERY_LINE, EVERY_PHASE, EVERY_DAY])
+def test_lines_are_buffered_until_flushed(flush_every):
+    n = narrator(flush_every)
+    n.write('first')
+    n.write('second')
+    expected = 'first\nsecond\n'
+    assert (n.sink.getvalue() == expected) == (flush_every == EVERY_LINE)
+    n.end_phase()
+    assert (n.sink.getvalue() == expected) == (flush_every != EVERY_DAY)
+    n.end_day()
+    assert n.sink.getvalue() == expected
+    n.write('third')
+    n.flush()
+    assert n.sink.getvalue() == expected + 'third\n'
+
+
+def told(n):
+    n.tell()
+    return n.sink.getvalue()
+
+
+def test_a_repeated_place_is_told_once():
+    n = narrator()
+    n.new(['P0', 'picks up', 'a knife', 'at the river'])
+    n.add(['P1', 'picks up', 'a rope', 'at the river'])
+    assert told(n) == 'P0 picks up a knife at the river, P1 picks up a rope.\n'
+
+
+def test_a_repeated_tool_is_told_once():
+    n = narrator()
+    n.new(['P0', 'wounds', 'P1', 'with his knife'])
+    n.add(['P2', 'wounds', 'P3', 'with her knife'])
+    assert told(n) == 'P0 wounds P1 with his knife, P2 wounds P3.\n'
+
+
+def test_phrases_are_counted_again_after_a_cut():
+    n = narrator()
+    n.new(['P0', 'hides', 'at the river'])
+    n.new(['P1', 'hides', 'at the river'])
+    assert told(n) == 'P0 hides at the river.\nP1 hides at the river.\n'
+
+
+def test_replaced_and_removed_phrases_are_counted():
+    n = narrator()
+    n.new(['P0', 'hides', 'at the river'])
+    n.replace('at the river', 'at the hill')
+    n.add(['P1', 'hides', 'at the river'])
+    n.add(['P2', 'hides', 'at the hill'])
+    n.remove('at the river')
+    n.add(['P3', 'hides', 'at the river'])
+    assert told(n) == 'P0 hides on the hill, P1 hides, P2 hides, P3 hides at the river.\n'
@@ -0,0 +1,30 @@
+import logging
+
+from thirst_games.game import Game
+from thirst_games.player.player import Player
+from thirst_games.world import World
+
+ROSTER = [(f'P{i}', i // 2 + 1, 'he' if i % 2 else 'she') for i in range(12)]
+
+
+def test_a_profiled_game_reports_its_decisions_and_actions(caplog):
+    world = World(0, headless=True, profile=True)
+    game = Game([Player(*p) for p in ROSTER], world)
+    with caplog.at_level(logging.INFO, logger='thirst_games.game'):
+        game.run()
+    profiles = world.profiler.phases
+    assert (1, 'starter') in profiles
+    hooks = {hook for profile in profiles.values() for hook, _ in profile.calls}
+    assert {'think', 'act', 'pref', 'apply'} <= hooks
+    assert all(seconds >= 0 for profile in profiles.values() for seconds in profile.seconds.values())
+    report = world.profiler.report()
+    assert '== PROFILE: day 1 starter ==' in report
+    assert [r.getMessage() for r in caplog.records if r.name == 'thirst_games.game'] == [report]
+
+
+def test_games_are_not_profiled_by_default(caplog):
+    world = World(0, headless=True)
+    with caplog.at_level(logging.INFO, logger='thirst_games.game'):
+        Game([Player(*p) for p in ROSTER], world).run()
+    assert world.profiler is None
+    assert not [r for r in caplog.records if r.name == 'thirst_games.game']
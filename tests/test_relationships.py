@@ -0,0 +1,121 @@
+from random import Random
+from types import SimpleNamespace
+
+import pytest
+
+from thirst_games.relationships import Relationships, SparseRelationships
+
+
+STORES = {
+    'dense': lambda size, seed=0: Relationships(size),
+    'sparse': lambda size, seed=0: SparseRelationships(size, seed),
+}
+
+
+def roster(size):
+    return [SimpleNamespace(index=i, district=i // 2 + 1) for i in range(size)]
+
+
+@pytest.fixture(params=sorted(STORES))
+def make_store(request):
+    return STORES[request.param]
+
+
+@pytest.fixture
+def store(make_store):
+    return make_store(6)
+
+
+def test_players_trust_themselves(store):
+    for i in range(store.size):
+        assert store.pair(i, i).friendship == 1
+        assert store.pair(i, i).trust == 1
+
+
+def test_pair_updates_one_direction(store):
+    friendship, trust = store.pair(0, 1).friendship, store.pair(0, 1).trust
+    before = store.pair(1, 0).friendship
+    store.pair(0, 1).add_friendship(0.25)
+    store.pair(0, 1).add_trust(-0.25)
+    assert store.pair(0, 1).friendship == pytest.approx(min(1, friendship + 0.25))
+    assert store.pair(0, 1).trust == pytest.approx(trust - 0.25)
+    assert store.pair(1, 0).friendship == before
+
+
+def test_updates_are_clipped(store):
+    store.pair(2, 3).add_friendship(5)
+    store.pair(2, 3).add_trust(-5)
+    assert store.pair(2, 3).friendship == 1
+    assert store.pair(2, 3).trust == -1
+
+
+def test_grouped_averages_and_updates_every_cell(store):
+    store.pair(0, 2).add_friendship(0.5)
+    store.pair(1, 3).add_friendship(-0.5)
+    group = store.grouped([0, 1], [2, 3])
+    expected = sum(store.pair(r, c).friendship for r in (0, 1) for c in (2, 3)) / 4
+    assert group.friendship == pytest.approx(expected)
+    before = {(r, c): store.pair(r, c).trust for r in (0, 1) for c in (2, 3)}
+    group.add_trust(0.1)
+    for (r, c), trust in before.items():
+        assert store.pair(r, c).trust == pytest.approx(max(-1, min(1, trust + 0.1)))
+
+
+def test_row_versions_follow_the_feeling_player(store):
+    store.pair(0, 1).add_friendship(0.1)
+    assert list(store.row_versions[:2]) == [1, 0]
+    store.grouped([1, 2], [0]).add_trust(0.1)
+    assert list(store.row_versions[:3]) == [1, 1, 1]
+
+
+def test_seed_stays_in_range_and_is_repeatable(make_store):
+    players = roster(8)
+    first, second = make_store(8), make_store(8)
+    first.seed(players, Random(3))
+    second.seed(players, Random(3))
+    for a in players:
+        for b in players:
+            pair = first.pair(a.index, b.index)
+            assert pair.friendship == second.pair(a.index, b.index).friendship
+            if a is b:
+                continue
+            if a.district == b.district:
+                assert 0.5 <= pair.friendship < 1 and 0 <= pair.trust < 0.5
+            else:
+                assert 0 <= pair.friendship < 1 and 0 <= pair.trust < 0.25
+
+
+def test_sparse_store_updates_like_the_dense_one():
+    size = 10
+    sparse = SparseRelationships(size, 7)
+    dense = Relationships(size)
+    sparse.seed(roster(size), Random(1))
+    for cell in range(size * size):
+        dense.friendship[cell] = sparse.friendship[cell]
+        dense.trust[cell] = sparse.trust[cell]
+    rng = Random(2)
+    for _ in range(200):
+        rows = rng.sample(range(size), rng.randint(1, 3))
+        columns = rng.sample(range(size), rng.randint(1, 3))
+        value = rng.uniform(-0.6, 0.6)
+        for store in (sparse, dense):
+            if len(rows) == len(columns) == 1:
+                store.pair(rows[0], columns[0]).add_friendship(value)
+            else:
+                store.grouped(rows, columns).add_trust(value)
+    assert [sparse.friendship[c] for c in range(size * size)] == list(dense.friendship)
+    assert [sparse.trust[c] for c in range(size * size)] == list(dense.trust)
+    assert sparse.row_versions == dense.row_versions
+
+
+def test_sparse_store_only_keeps_districts_and_touched_pairs():
+    size = 10
+    store = SparseRelationships(size, 7)
+    store.seed(roster(size), Random(1))
+    stored = len(store.friendship)
+    assert stored == size + size  # the diagonal and both directions of each district pair
+    untouched = store.pair(0, 9).friendship
+    assert untouched == SparseRelationships(size, 7).pair(0, 9).friendship
+    assert untouched != SparseRelationships(size, 8).pair(0, 9).friendship
+    store.pair(0, 9).add_friendship(0.1)
+    assert len(store.friendship) == stored + 1
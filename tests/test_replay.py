@@ -0,0 +1,67 @@
+import io
+
+import pytest
+
+from thirst_games.arena import ArenaGenerator
+from thirst_games.event_log import PHASES
+from thirst_games.game import Game
+from thirst_games.player.player import Player
+from thirst_games.replay import Archive, Recorder, decode_game, encode_game, render_events, replay
+from thirst_games.world import World
+
+ROSTER = [(f'P{i}', i // 2 + 1, 'he' if i % 2 else 'she') for i in range(12)]
+
+
+def play(seed, **kwargs) -> Game:
+    game = Game([Player(*p) for p in ROSTER], World(seed, headless=True, record=True), **kwargs)
+    game.run()
+    return game
+
+
+def test_encode_decode_round_trip():
+    game = play(1, arena=ArenaGenerator(), sparse_relationships=True)
+    archived = decode_game(encode_game(game))
+    assert archived.seed == 1
+    assert archived.sparse_relationships
+    assert archived.arena.biomes == game.arena.biomes
+    assert archived.roster == ROSTER
+    assert archived.areas == [a.full_name for a in game.map.areas]
+    assert archived.records == game.world.log.records
+
+
+def test_archive_replays_every_game(tmp_path):
+    games = [play(seed) for seed in range(3)]
+    path = tmp_path / 'games.tg'
+    with open(path, 'wb') as file:
+        recorder = Recorder(file)
+        for game in games:
+            recorder.write(game)
+    with Archive(str(path)) as archive:
+        archived = list(archive)
+        assert [a.seed for a in archived] == [0, 1, 2]
+        for game, a in zip(games, archived):
+            story = io.StringIO()
+            replayed = replay(a, story)
+            assert replayed.result() == game.result()
+            assert story.getvalue()
+
+
+def test_unrecorded_games_cannot_be_archived():
+    game = Game([Player(*p) for p in ROSTER], World(0, headless=True))
+    with pytest.raises(ValueError):
+        encode_game(game)
+
+
+def test_other_files_are_not_archives(tmp_path):
+    path = tmp_path / 'other.tg'
+    path.write_bytes(b'not a game archive')
+    with pytest.raises(ValueError):
+        Archive(str(path))
+
+
+def test_events_are_rendered_with_the_phase_name():
+    archived = decode_game(encode_game(play(0)))
+    lines = list(render_events(archived))
+    assert len(lines) == len(archived.records)
+    assert lines[0].startswith('day 1 starter ')
+    assert all(line.split()[2] in PHASES for line in lines)
@@ -0,0 +1,38 @@
+import pytest
+
+from benchmarks.suite import make_game, scattered_game
+from thirst_games.constants import START_AREA
+from thirst_games.player.policy import HeuristicPolicy
+
+pytest.importorskip('numpy')
+
+
+def decisions_of(game):
+    # without the random part of the preferences, the two policies judge the same arena the same way
+    for p in game.players:
+        p.wisdom = 1
+    for area in game.map.areas:
+        players = list(area.players)
+        for i in range(0, len(players) - 1, 3):
+            game.world.alliances.join(players[i], players[i + 1])
+    game.context.new_day()
+    entities = [e for area in game.map.areas for e in game.playing_entities_at(area)]
+    return game.world.policy.decisions(entities)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_vectorized_engine_decides_like_the_heuristics(seed):
+    for game in (scattered_game(24, seed, vectorized=True), make_game(24, seed, vectorized=True)):
+        decisions = decisions_of(game)
+        assert any(len(d.entity.players) > 1 for d in decisions)
+        engine = game.world.policy.choose(decisions)
+        heuristics = HeuristicPolicy().choose(decisions)
+        assert [s.name for s in engine] == [s.name for s in heuristics]
+
+
+def test_vectorized_engine_only_picks_candidates():
+    game = make_game(24, 0, vectorized=True)
+    game.context.forbid([game.map.get_area(START_AREA)])
+    decisions = decisions_of(game)
+    for d, strategy in zip(decisions, game.world.policy.choose(decisions)):
+        assert strategy in d.candidates
@@ -0,0 +1,43 @@
+import io
+
+from thirst_games.game import Game
+from thirst_games.player.player import Player
+from thirst_games.world import World, child_seed
+
+ROSTER = [(f'P{i}', i // 2 + 1, 'he' if i % 2 else 'she') for i in range(12)]
+
+
+def play(world: World) -> Game:
+    game = Game([Player(*p) for p in ROSTER], world)
+    game.run()
+    return game
+
+
+def story(seed) -> str:
+    output = io.StringIO()
+    play(World(seed, output=output))
+    return output.getvalue()
+
+
+def test_a_seed_replays_the_same_game():
+    for seed in range(5):
+        assert play(World(seed, headless=True)).result() == play(World(seed, headless=True)).result()
+    assert story(3) == story(3)
+
+
+def test_seeds_give_different_games():
+    results = [play(World(seed, headless=True)).result() for seed in range(5)]
+    assert any(r != results[0] for r in results[1:])
+
+
+def test_headless_games_end_like_narrated_ones():
+    for seed in range(5):
+        narrated = play(World(seed, output=io.StringIO())).result()
+        assert play(World(seed, headless=True)).result() == narrated
+
+
+def test_spawned_worlds_keep_the_options_and_get_their_own_seed():
+    world = World(4, headless=True, record=True)
+    spawned = world.spawn(2)
+    assert spawned.seed == child_seed(4, 2) != world.seed
+    assert spawned.headless and spawned.log is not None and not spawned.vectorized
@@ -22,17 +22,10 @@ _nature = {
     }
 }
 
-_ids = {}
-
-
 class Area:
-    def __init__(self, name: str):
-        if name in _ids:
-            _ids[name] += 1
-            self.id = _ids[name]
-        else:
-            _ids[name] = 0
-            self.id = 0
+    def __init__(self, name: str, id: int=0, index: int=0):
+        self.id = id  # rank among the areas sharing this name
+        self.index = index  # position in the map, stable for the whole game
         self.name = name
         self.at = f'at the {name}'
         self.to = f'to the {name}'
@@ -1,18 +1,88 @@
-from typing import Union, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, Union, List, Optional
 
 from thirst_games.abstract.area import Area
 from thirst_games.abstract.items import Item, Weapon
 
 
+def tracked(name: str) -> property:
+    # an attribute whose assignment makes the derived stats of the entity stale, its reads stay plain
+    key = name + '_'
+
+    def setter(self, value):
+        self.__dict__[key] = value
+        self._stats.clear()
+    return property(attrgetter(key), setter)
+
+
+def derived_stat(method):
+    # a read-only property memoized on the entity until its state changes
+    name = method.__name__
+
+    def getter(self):
+        stats = self._stats
+        if name in stats:
+            if self.context is not None:
+                self.context.stat_hits += 1
+            return stats[name]
+        if self.context is not None:
+            self.context.stat_misses += 1
+        value = stats[name] = method(self)
+        return value
+    getter.__doc__ = method.__doc__
+    return property(getter)
+
+
+class TrackedList(list):
+    # a list whose changes make the derived stats of its owner stale
+    def __init__(self, owner: 'Entity') -> None:
+        list.__init__(self)
+        self._owner = owner
+
+    def append(self, item):
+        list.append(self, item)
+        self._owner.stats_changed()
+
+    def remove(self, item):
+        list.remove(self, item)
+        self._owner.stats_changed()
+
+    def extend(self, items):
+        list.extend(self, items)
+        self._owner.stats_changed()
+
+    def clear(self):
+        list.clear(self)
+        self._owner.stats_changed()
+
+
 class Entity:
+    _current_area = tracked('_current_area')
+
     def __init__(self, name: str, he: str='it'):
+        self._stats: Dict[str, Any] = {}  # derived stats, see derived_stat
         self._name = name
         self.he = he
         self.him = 'him' if he == 'he' else ('her' if he == 'she' else 'it')
         self.his = 'his' if he == 'he' else ('her' if he == 'she' else 'its')
-        self.status: List[str] = []
+        self.status: List[str] = TrackedList(self)
         self._current_area: Area = None
         self.stealth: float = 0
+        self.world = None
+        self.map = None
+        self.narrator = None
+        self.context = None
+        self.rng = None
+
+    def stats_changed(self):
+        self._stats.clear()
+
+    def bind(self, world):
+        self.world = world
+        self.map = world.map
+        self.narrator = world.narrator
+        self.context = world.context
+        self.rng = world.rng
 
     @property
     def name(self):
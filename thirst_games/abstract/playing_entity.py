@@ -1,9 +1,11 @@
-from random import random
+import logging
 from typing import List
 
 from thirst_games.abstract.area import Area
 from thirst_games.abstract.entity import Entity, FightingEntity, CarryingEntity
-from thirst_games.narrator import Narrator
+from thirst_games.event_log import Verb
+
+logger = logging.getLogger(__name__)
 
 
 class PlayingEntity(FightingEntity, CarryingEntity):
@@ -21,6 +23,9 @@ class PlayingEntity(FightingEntity, CarryingEntity):
     def think(self):
         raise NotImplementedError
 
+    def candidate_strategies(self) -> list:
+        raise NotImplementedError
+
     def act(self):
         raise NotImplementedError
 
@@ -49,12 +54,14 @@ class PlayingEntity(FightingEntity, CarryingEntity):
 
     def ask_to_ally(self, player):
         self.reveal()
-        if random() < player.want_to_ally(self):
-            Narrator().new([self.name, 'proposes', 'an alliance to', player.name, 'and', player.he, 'accepts!'])
+        if self.rng.random() < player.want_to_ally(self):
+            self.narrator.new([self.name, 'proposes', 'an alliance to', player.name, 'and', player.he, 'accepts!'])
+            self.narrator.record(Verb.ALLY, self, player)
             self.new_ally(player)
             player.new_ally(self)
         else:
-            Narrator().new([self.name, 'proposes', 'an alliance to', player.name, 'but', player.he, 'refuses'])
+            self.narrator.new([self.name, 'proposes', 'an alliance to', player.name, 'but', player.he, 'refuses'])
+            self.narrator.record(Verb.REFUSE, self, player)
             self.relationship(player).add_friendship(-0.5)
             self.relationship(player).add_trust(-2)
             self.relationship(player).add_trust(1)  # trust = 0
@@ -66,7 +73,7 @@ class PlayingEntity(FightingEntity, CarryingEntity):
         raise NotImplementedError
 
     def is_allied_to(self, player):
-        return self.relationship(player).allied
+        return self.world.alliances.all_allied([*self.players, *player.players])
 
     def remove_item(self, item):
         raise NotImplementedError
@@ -74,70 +81,28 @@ class PlayingEntity(FightingEntity, CarryingEntity):
 
 class Strategy:
     def __init__(self, name, pref, action):
-        self.name = name
+        self._name = name
         self.pref = pref
         self.action = action
 
-    def apply(self, player: PlayingEntity):
-        out = self.action(player)
-        if isinstance(out, str):
-            print(f'{str(player)} {out}')
-
-
-class Relationship:
-    def __init__(self):
-        self._friendship = 0
-        self._trust = 0
-        self._allied = False
-
-    @property
-    def friendship(self):
-        return self._friendship
-
-    def add_friendship(self, value: float):
-        self._friendship = max(-1, min(1, self._friendship + value))
-
-    @property
-    def trust(self):
-        return self._trust
-
-    def add_trust(self, value: float):
-        self._trust = max(-1, min(1, self._trust + value))
-
     @property
-    def allied(self) -> bool:
-        return self._allied
-
-    def set_allied(self, value: bool):
-        self._allied = value
-
-
-class GroupedRelationship(Relationship):
-    def __init__(self, relations: List[Relationship]):
-        Relationship.__init__(self)
-        self.sub_relations = relations
+    def name(self) -> str:
+        return self._name
 
     @property
-    def friendship(self):
-        return sum([r.friendship for r in self.sub_relations]) / len(self.sub_relations)
-
-    def add_friendship(self, value: float):
-        for r in self.sub_relations:
-            r.add_friendship(value)
+    def kind(self) -> str:
+        # the same for every strategy sharing a preference and an action, whatever their target
+        return self.name
 
-    @property
-    def trust(self):
-        return sum([r.trust for r in self.sub_relations]) / len(self.sub_relations)
+    def perform(self, player: PlayingEntity):
+        # apply, timed when the world is profiled
+        profiler = player.world.profiler
+        if profiler is None:
+            return self.apply(player)
+        return profiler.timed('apply', self.kind, self.apply, player)
 
-    def add_trust(self, value: float):
-        for r in self.sub_relations:
-            r.add_trust(value)
-
-    @property
-    def allied(self) -> bool:
-        return sum([r.allied for r in self.sub_relations]) == len(self.sub_relations)
-
-    def set_allied(self, value: bool):
-        for r in self.sub_relations:
-            r.set_allied(value)
+    def apply(self, player: PlayingEntity):
+        out = self.action(player)
+        if isinstance(out, str):
+            logger.warning(f'{str(player)} {out}')
 
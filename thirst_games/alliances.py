@@ -0,0 +1,83 @@
+from typing import Any, Dict, Iterable, List
+
+
+class _Members(dict):
+    # the ordered members of an alliance, stamped each time they change
+    __slots__ = ['stamp']
+
+
+class Alliances:
+    # disjoint sets of allied players: each player points to the ordered members of its alliance,
+    # unions move the smaller alliance into the bigger one
+    def __init__(self) -> None:
+        self._alliance: Dict[Any, _Members] = {}
+        self._clock = 0
+
+    def _new(self, player) -> _Members:
+        members = _Members({player: None})
+        self._touch(members)
+        return members
+
+    def _touch(self, members: _Members):
+        self._clock += 1
+        members.stamp = self._clock
+
+    def alliance(self, player) -> Dict[Any, None]:
+        if player not in self._alliance:
+            self._alliance[player] = self._new(player)
+        return self._alliance[player]
+
+    def stamp(self, player) -> int:
+        # changes whenever the members of the player's alliance change, and only then
+        return self.alliance(player).stamp
+
+    def size(self, player) -> int:
+        return len(self.alliance(player))
+
+    def allied(self, player_a, player_b) -> bool:
+        return player_a is player_b or self.alliance(player_a) is self.alliance(player_b)
+
+    def all_allied(self, players: Iterable) -> bool:
+        alliances = [self.alliance(p) for p in players]
+        return all(a is alliances[0] for a in alliances)
+
+    def join(self, *players):
+        # merges the alliances of all the given players
+        for player in players[1:]:
+            big = self.alliance(players[0])
+            small = self.alliance(player)
+            if big is small:
+                continue
+            if len(small) > len(big):
+                big, small = small, big
+            big.update(small)
+            self._touch(big)
+            for member in small:
+                self._alliance[member] = big
+
+    def leave(self, player):
+        # the player goes on alone, the rest of the alliance stays together
+        alliance = self.alliance(player)
+        if len(alliance) > 1:
+            del alliance[player]
+            self._touch(alliance)
+            self._alliance[player] = self._new(player)
+
+    def split(self, players: List):
+        # the given players leave their alliances and stay allied together
+        for player in players:
+            self.leave(player)
+        self.join(*players)
+
+    def remove(self, player):
+        alliance = self._alliance.pop(player, None)
+        if alliance is not None:
+            del alliance[player]
+            self._touch(alliance)
+
+    def groups(self, players: Iterable) -> List[List]:
+        # the given players bucketed by alliance, in order of first appearance
+        groups: Dict[int, List] = {}
+        for player in players:
+            groups.setdefault(id(self.alliance(player)), []).append(player)
+        return list(groups.values())
@@ -0,0 +1,45 @@
+from typing import Dict, Optional
+
+from thirst_games.abstract.area import _nature
+from thirst_games.constants import START_AREA
+from thirst_games.map import Map, random_bag, random_weapon
+
+
+class ArenaGenerator:
+    # builds as many areas as the roster needs, so the population of each area stays bounded once the
+    # bloodbath is over. everyone still starts at the cornucopia, where each thinker weighs an alliance with
+    # everyone else: the starter phases stay quadratic in the roster size. a 1000-player game runs to the end
+    # in about 7 minutes, most of them in the bloodbath, 10000 players don't get past it in practice
+    def __init__(
+            self, players_per_area: float=4, biomes: Optional[Dict[str, float]]=None, loot_density: float=0.2,
+            weapon_ratio: float=0.5,
+    ) -> None:
+        if players_per_area <= 0:
+            raise ValueError(f'players_per_area must be positive, not {players_per_area}')
+        if biomes is None:
+            biomes = {name: 1 for name in _nature.keys() if name != START_AREA}
+        unknown = [name for name in biomes.keys() if name not in _nature or name == START_AREA]
+        if len(unknown):
+            raise ValueError(f'Unknown biomes: {unknown}')
+        if not len(biomes) or sum(biomes.values()) <= 0:
+            raise ValueError('At least one biome needs a positive weight')
+        self.players_per_area = players_per_area
+        self.biomes = biomes
+        self.loot_density = loot_density  # mean amount of loot lying in each area
+        self.weapon_ratio = weapon_ratio
+
+    def area_count(self, player_amount: int) -> int:
+        return max(1, int(round(player_amount / self.players_per_area)))
+
+    def build(self, arena: Map, player_amount: int):
+        rng = arena.rng
+        names = list(self.biomes.keys())
+        weights = [self.biomes[name] for name in names]
+        for name in rng.choices(names, weights, k=self.area_count(player_amount)):
+            area = arena.add_area(name)
+            loot = int(self.loot_density)
+            if rng.random() < self.loot_density - loot:
+                loot += 1
+            for i in range(loot):
+                area.loot.append(random_weapon(rng) if rng.random() < self.weapon_ratio else random_bag(rng))
+        arena.stock_cornucopia(arena.add_area(START_AREA), player_amount)
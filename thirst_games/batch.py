@@ -0,0 +1,56 @@
+import os
+from multiprocessing import Pool
+from random import Random
+from typing import List, Optional, Tuple
+
+from thirst_games.game import Game
+from thirst_games.player.player import Player
+from thirst_games.replay import encode_game
+from thirst_games.world import World, child_seed
+
+Roster = List[Tuple[str, int, str]]
+
+
+def run_game(roster: Roster, seed: Optional[int]=None, record=False) -> dict:
+    # the same roster and seed always replay the same game
+    # with record, the result holds the encoded game under 'replay', for a replay.Recorder
+    world = World(seed, headless=True, record=record)
+    try:
+        game = Game([Player(name, district, he) for name, district, he in roster], world)
+        game.run()
+        result = game.result()
+        if record:
+            result['replay'] = encode_game(game)
+    except Exception as e:
+        result = {'error': repr(e)}
+    result['seed'] = world.seed
+    return result
+
+
+def _run_indexed_game(job: Tuple[int, int, Roster, int, bool]) -> dict:
+    roster_index, game_index, roster, seed, record = job
+    result = run_game(roster, seed, record)
+    result['roster'] = roster_index
+    result['game'] = game_index
+    return result
+
+
+def run_many(
+        rosters: List[Roster], n_games: int, workers: Optional[int]=None, seed: Optional[int]=None, record=False,
+) -> List[dict]:
+    # plays n_games games per roster, spread over a pool of workers (one per core by default)
+    # each game gets its own stream derived from the batch seed, whichever worker plays it
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if seed is None:
+        seed = Random().getrandbits(64)
+    jobs = [
+        (r, g, roster, child_seed(seed, f'{r}/{g}'), record) for r, roster in enumerate(rosters) for g in range(n_games)
+    ]
+    if workers == 1:
+        return [_run_indexed_game(job) for job in jobs]
+    chunksize = max(1, len(jobs) // (workers * 8))
+    with Pool(workers) as pool:
+        results = list(pool.imap_unordered(_run_indexed_game, jobs, chunksize=chunksize))
+    results.sort(key=lambda x: (x['roster'], x['game']))
+    return results
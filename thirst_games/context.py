@@ -1,12 +1,11 @@
-from typing import List
+from typing import Any, Dict, List
 
 from thirst_games.abstract.playing_entity import PlayingEntity
-from thirst_games.map import Map
-from thirst_games.singleton import Singleton
 
 
 class AbstractGame:
     alive_players = []
+    player_count = 0
     time = None
     day = 0
     going_to_cornucopia = 0
@@ -18,13 +17,26 @@ class AbstractGame:
         raise NotImplementedError
 
 
-class Context(metaclass=Singleton):
+class Context:
     def __init__(self):
         self.game: AbstractGame = None
-        self.forbidden_areas = []
+        self.forbidden_areas = []  # change it through forbid() and new_day(), which bump forbidden_version
+        self.forbidden_version = 0
+        self.phase = 0  # index in event_log.PHASES of the phase being played, set by Game.launch
+        self.strategy_catalogs: Dict[tuple, list] = {}  # shared by all thinkers during a phase
+        self.alliance_offers: Dict[Any, Any] = {}  # one AllianceStrat per player, shared the same way
+        self.stat_hits = 0  # reads of derived stats served from the memo
+        self.stat_misses = 0
+
+    def forbid(self, areas):
+        self.forbidden_areas.extend(areas)
+        self.forbidden_version += 1
 
     def new_day(self):
         self.forbidden_areas.clear()
+        self.forbidden_version += 1
+        self.strategy_catalogs.clear()
+        self.alliance_offers.clear()
 
     @property
     def alive_players(self):
@@ -32,7 +44,7 @@ class Context(metaclass=Singleton):
 
     @property
     def player_count(self) -> int:
-        return len(self.alive_players)
+        return self.game.player_count
 
     @property
     def time(self):
@@ -1,13 +1,11 @@
 from typing import List
 
 from copy import copy
-from random import random, choice, randint
 
 from thirst_games.abstract.items import Weapon, Bottle, Item, Bag
 from thirst_games.constants import SWORD, MACE, AXE
-from thirst_games.context import Context
-from thirst_games.map import Map, START_AREA, Area
-from thirst_games.narrator import Narrator, format_list
+from thirst_games.map import START_AREA, Area
+from thirst_games.narrator import format_list
 
 
 # TODO: sometimes events don't seem to affect everyone
@@ -15,7 +13,8 @@ from thirst_games.poison import Food
 
 
 class Event:
-    def __init__(self, name: str, areas: List[Area]):
+    def __init__(self, world, name: str, areas: List[Area]):
+        self.world = world
         self.name = name
         self.areas = areas
 
@@ -23,7 +22,7 @@ class Event:
         raise NotImplementedError
 
     @classmethod
-    def can_happen(cls) -> bool:
+    def can_happen(cls, world) -> bool:
         raise NotImplementedError
 
 
@@ -31,11 +30,11 @@ class DamageEvent(Event):
     water = 0
 
     def __init__(
-            self, name: str, it: str, stealth=0.6, weapon_name='', remove_loot=False,
+            self, world, name: str, it: str, stealth=0.6, weapon_name='', remove_loot=False,
             base_damage: float=0, extra_damage: float=0, dies='dies', trapped_means_dead=False,
     ):
-        areas = self.available_areas()
-        area_names = list(set(area.name for area in areas))
+        areas = self.available_areas(world)
+        area_names = sorted(set(area.name for area in areas))
         players_by_area_names = {
             area_name: sum([len(area.players) for area in areas if area.name == area_name]) for area_name in area_names
         }
@@ -50,7 +49,7 @@ class DamageEvent(Event):
         area_names = [area_name for area_name in area_names if players_by_area_names[area_name]]
 
         picked_areas = []
-        while sum([len(area.players) for area in picked_areas]) < 3 * Context().player_count / 4 \
+        while sum([len(area.players) for area in picked_areas]) < 3 * world.context.player_count / 4 \
                 and areas \
                 and area_names:
             picked_area_name = area_names.pop(0)
@@ -60,7 +59,7 @@ class DamageEvent(Event):
 
             if sum([len(area.players) for area in new_areas]):
                 picked_areas.extend(new_areas)
-        Event.__init__(self, name, picked_areas)
+        Event.__init__(self, world, name, picked_areas)
         self.stealth = stealth
         self.it = it
         self.weapon_name = weapon_name
@@ -71,60 +70,62 @@ class DamageEvent(Event):
         self.remove_loot = remove_loot
 
     def trigger(self):
-        Context().forbidden_areas.extend(self.areas)
+        rng = self.world.rng
+        self.world.context.forbid(self.areas)
         saw_it_coming = []
         warned = []
-        # Narrator().add(['should trigger for', [p.name for a in self.areas for p in a.players]])
+        # self.world.narrator.add(['should trigger for', [p.name for a in self.areas for p in a.players]])
         for area in self.areas:
-            for p_e in Context().playing_entities_at(area):
+            for p_e in self.world.context.playing_entities_at(area):
                 for p in p_e.players:
-                    if p.wisdom * random() > self.stealth:
+                    if p.wisdom * rng.random() > self.stealth:
                         saw_it_coming.append(p.name)
                         warned.extend(p_e.players)
                         break
-        if len(saw_it_coming):
-            Narrator().new([
+        if len(saw_it_coming) and self.world.narrator.active:
+            self.world.narrator.new([
                 format_list(saw_it_coming), 'see' if len(saw_it_coming) > 1 else 'sees', self.it, 'coming'
             ])
         for area in self.areas:
             area_players = copy(area.players)
             for p in area_players:
-                Narrator().cut()
+                self.world.narrator.cut()
 
                 if p.can_flee():
                     if p in warned:
                         p.flee()
                         if p.current_area in self.areas:
-                            Narrator().new([
-                                'error:', 'forbidden:', Context().forbidden_areas, p.name, p.current_area.at])
-                            Map().test = 'SHIT'
+                            self.world.narrator.new([
+                                'error:', 'forbidden:', self.world.context.forbidden_areas, p.name, p.current_area.at])
+                            self.world.map.test = 'SHIT'
                     elif p.be_damaged(self.base_damage, weapon=self.weapon_name):
-                        Narrator().new([p.name, 'fails', 'to escape', self.it, 'and', self.dies, area.at])
+                        self.world.narrator.new([p.name, 'fails', 'to escape', self.it, 'and', self.dies, area.at])
                     else:
-                        Narrator().apply_stock()
+                        self.world.narrator.apply_stock()
                         p.flee(panic=True, drop_verb='loses')
                     continue  # successful escape
-                Narrator().new([p.name, 'is', 'trapped', area.at])
+                self.world.narrator.new([p.name, 'is', 'trapped', area.at])
                 if self.trapped_means_dead:
                     p.be_damaged(1)
-                    Narrator().add([p.name, 'is', 'swiped', 'by', self.it, area.at, 'and', self.dies])
-                elif p.be_damaged(random() * self.extra_damage + self.base_damage, weapon=self.weapon_name):
-                    Narrator().add(['and', self.dies])
+                    self.world.narrator.add([p.name, 'is', 'swiped', 'by', self.it, area.at, 'and', self.dies])
+                elif p.be_damaged(rng.random() * self.extra_damage + self.base_damage, weapon=self.weapon_name):
+                    self.world.narrator.add(['and', self.dies])
                 else:
-                    Narrator().apply_stock()
-                if not len(Narrator().current_sentence):  # error
-                    Narrator().add([p.name, 'escaped', self.it, 'and is', p.current_area.at])
-            Narrator().clear_stock()
+                    self.world.narrator.apply_stock()
+                if not len(self.world.narrator.current_sentence):  # error
+                    self.world.narrator.add([p.name, 'escaped', self.it, 'and is', p.current_area.at])
+            self.world.narrator.clear_stock()
             if self.remove_loot:
                 area.loot.clear()
+                self.world.map.loot_changed(area)
 
     @classmethod
-    def can_happen(cls) -> bool:
-        return len([a for a in cls.available_areas() if len(a.players)]) > 0
+    def can_happen(cls, world) -> bool:
+        return len([a for a in cls.available_areas(world) if len(a.players)]) > 0
 
     @classmethod
-    def available_areas(cls) -> List[Area]:
-        areas = copy(Map().areas)
+    def available_areas(cls, world) -> List[Area]:
+        areas = copy(world.map.areas)
         if cls.water == -1:
             areas = [a for a in areas if not a.has_water]
         if cls.water == 1:
@@ -135,9 +136,9 @@ class DamageEvent(Event):
 class WildFire(DamageEvent):
     water = -1
 
-    def __init__(self):
+    def __init__(self, world):
         DamageEvent.__init__(
-            self, 'wildfire', 'the fire',
+            self, world, 'wildfire', 'the fire',
             weapon_name='fire', dies='burns to death',
             base_damage=0.3, extra_damage=0.2, remove_loot=True,
         )
@@ -146,74 +147,77 @@ class WildFire(DamageEvent):
 class Flood(DamageEvent):
     water = 1
 
-    def __init__(self):
+    def __init__(self, world):
         DamageEvent.__init__(
-            self, 'flood', 'the flood', dies='drowns', trapped_means_dead=True, remove_loot=True,
+            self, world, 'flood', 'the flood', dies='drowns', trapped_means_dead=True, remove_loot=True,
         )
 
 
 class AcidGas(DamageEvent):
-    def __init__(self):
+    def __init__(self, world):
         DamageEvent.__init__(
-            self, 'acid cloud', 'the acid',
+            self, world, 'acid cloud', 'the acid',
             weapon_name='acid', dies='melts into a puddle of blood',
             base_damage=0.2, trapped_means_dead=True, stealth=0.7,
         )
 
 
 class Wasps(DamageEvent):
-    def __init__(self):
+    def __init__(self, world):
         DamageEvent.__init__(
-            self, 'killer wasps', 'the wasps',
+            self, world, 'killer wasps', 'the wasps',
             weapon_name='acid', dies='dies from anaphylactic shock',
             base_damage=0.2, extra_damage=0.4, stealth=0.8,
         )
 
 
 class Beasts(DamageEvent):
-    def __init__(self):
+    def __init__(self, world):
         DamageEvent.__init__(
-            self, choice(['dogs', 'killer monkeys']), 'the beasts',
+            self, world, world.rng.choice(['dogs', 'killer monkeys']), 'the beasts',
             weapon_name='teeth', dies='is eaten alive',
             base_damage=0.2, extra_damage=0.4, stealth=0.7,
         )
 
 
 class DropEvent(Event):
-    def __init__(self):
-        possible_areas = [area for area in Map().areas if not len(area.players)]
+    def __init__(self, world):
+        possible_areas = [area for area in world.map.areas if not len(area.players)]
         if START_AREA in possible_areas:
-            area = Map().get_area(START_AREA)
+            area = world.map.get_area(START_AREA)
         else:
-            area = choice(possible_areas)
-        Event.__init__(self, 'drop', [area])
+            area = world.rng.choice(possible_areas)
+        Event.__init__(self, world, 'drop', [area])
 
     def trigger(self):
+        rng = self.world.rng
         possible_loots = [
-            Food(choice(['ration', 'food can', 'energy bar']), 0.75),
-            Food(choice(['ration', 'food can', 'energy bar']), 0.50),
-            Food(choice(['ration', 'food can', 'energy bar']), 0.25),
+            Food(rng.choice(['ration', 'food can', 'energy bar']), 0.75, rng),
+            Food(rng.choice(['ration', 'food can', 'energy bar']), 0.50, rng),
+            Food(rng.choice(['ration', 'food can', 'energy bar']), 0.25, rng),
             Item('bandages'), Item('iodine'), Item('antidote'), Bottle(1),
-            Weapon(choice([SWORD, AXE, MACE]), 2 + random())
+            Weapon(rng.choice([SWORD, AXE, MACE]), 2 + rng.random())
         ]
-        possible_loots = [i for i in possible_loots if sum(p.estimate(i) for p in Context().alive_players)]
-        possible_loots.sort(key=lambda x: -sum(p.estimate(x) for p in Context().alive_players))
+        possible_loots = [i for i in possible_loots if sum(p.estimate(i) for p in self.world.context.alive_players)]
+        possible_loots.sort(key=lambda x: -sum(p.estimate(x) for p in self.world.context.alive_players))
         area = self.areas[0]
-        nb_bags = randint(1, len(Context().alive_players) - 1)
+        nb_bags = rng.randint(1, len(self.world.context.alive_players) - 1)
         while nb_bags > len(possible_loots):
             possible_loots.extend(possible_loots)
         bags = []
         for i in range(nb_bags):
             bags.append(Bag([possible_loots[i], possible_loots[-(i + 1)]]))
         for bag in bags:
-            Map().add_loot(bag, area)
+            self.world.map.add_loot(bag, area)
+        if not self.world.narrator.active:
+            return
         verb = 'have' if nb_bags > 1 else 'has'
-        Narrator().new([nb_bags, 'bag' + ('s' if nb_bags > 1 else ''), verb, 'been dropped', area.at])
-        Narrator().new([
+        self.world.narrator.new([nb_bags, 'bag' + ('s' if nb_bags > 1 else ''), verb, 'been dropped', area.at])
+        self.world.narrator.new([
             'The bag' + ('s' if nb_bags > 1 else ''), 'contain' + ('s' if nb_bags == 1 else ''),
             format_list([i.name for b in bags for i in b.content])])
 
     @classmethod
-    def can_happen(cls) -> bool:
+    def can_happen(cls, world) -> bool:
         # needs an empty area
-        return len([area for area in Map().areas if not len(area.players)]) > 0
+        return len([area for area in world.map.areas if not len(area.players)]) > 0
@@ -0,0 +1,93 @@
+from enum import IntEnum
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+
+from thirst_games.constants import STARTER, MORNING, AFTERNOON, NIGHT
+
+PHASES = [STARTER, MORNING, AFTERNOON, NIGHT]
+NOBODY = -1  # actor, target or area of a record that has none
+
+
+class Verb(IntEnum):
+    KILL = 1  # actor kills target
+    DIE = 2  # actor dies, whatever the cause
+    HIT = 3  # actor hits target without killing
+    MISS = 4  # actor misses target
+    FLEE = 5  # actor flees to area
+    ALLY = 6  # actor's offer is accepted by target
+    REFUSE = 7  # actor's offer is refused by target
+    BETRAY = 8  # actor betrays target
+    PICK_UP = 9  # actor picks up an item (named in weapon)
+    ARENA_EVENT = 10  # the arena strikes area (event name in weapon)
+    WIN = 11  # actor wins the game
+
+
+class Record(NamedTuple):
+    day: int
+    phase: int  # index in PHASES
+    verb: Verb
+    actor: int  # player index in the roster, a group is recorded once per member
+    target: int  # player index in the roster, a group is recorded once per member
+    area: int  # area index in the map
+    weapon: str  # weapon, item or event name, '' when there is none
+
+
+_templates = {
+    Verb.KILL: '{actor} kills {target}{at}{weapon}',
+    Verb.DIE: '{actor} dies{at}',
+    Verb.HIT: '{actor} hits {target}{at}{weapon}',
+    Verb.MISS: '{actor} misses {target}{at}',
+    Verb.FLEE: '{actor} flees to {area}',
+    Verb.ALLY: '{actor} allies with {target}',
+    Verb.REFUSE: '{target} refuses an alliance with {actor}',
+    Verb.BETRAY: '{actor} betrays {target}',
+    Verb.PICK_UP: '{actor} picks up {weapon_name}{at}',
+    Verb.ARENA_EVENT: '{weapon_name} strikes {area}',
+    Verb.WIN: '{actor} wins',
+}
+
+
+def _member_ids(entity) -> List[int]:
+    # the index of a player, or of each member of a group
+    if entity is None:
+        return [NOBODY]
+    return [p.index for p in entity.players]
+
+
+class EventLog:
+    # typed records of what happens in a game, for statistics, tools and archives (see World(record=True)):
+    # they are read without going through the prose of the narrator, and kept in headless games too
+    def __init__(self, context) -> None:
+        self.context = context
+        self.records: List[Record] = []
+
+    def record(self, verb: Verb, actor=None, target=None, area=None, weapon: str=''):
+        day = self.context.game.day
+        phase = self.context.phase
+        area = NOBODY if area is None else area.index
+        for a in _member_ids(actor):
+            for t in _member_ids(target):
+                self.records.append(Record(day, phase, verb, a, t, area, weapon))
+
+    def query(self, verb: Optional[Verb]=None, actor: Optional[int]=None, target: Optional[int]=None,
+              day: Optional[int]=None) -> List[Record]:
+        return [
+            r for r in self.records
+            if (verb is None or r.verb == verb) and (actor is None or r.actor == actor)
+            and (target is None or r.target == target) and (day is None or r.day == day)
+        ]
+
+    def render(self, names: Sequence[str], area_names: Sequence[str]) -> Iterator[str]:
+        # plain prose, built only when asked for
+        for r in self.records:
+            area = area_names[r.area] if r.area != NOBODY else ''
+            yield _templates[r.verb].format(
+                actor=names[r.actor] if r.actor != NOBODY else 'someone',
+                target=names[r.target] if r.target != NOBODY else 'someone',
+                area=f'the {area}',
+                at=f' at the {area}' if area else '',
+                weapon=f' with {r.weapon}' if r.weapon else '',
+                weapon_name=r.weapon,
+            ) + '.'
+
+    def __len__(self) -> int:
+        return len(self.records)
@@ -1,54 +1,80 @@
 #!python
-from typing import List, Optional, Union
+import logging
+from typing import Dict, KeysView, List, Optional, Union
 
 from copy import copy
-from random import random, choice
 
 from thirst_games.abstract.entity import Entity
 from thirst_games.abstract.playing_entity import PlayingEntity
+from thirst_games.arena import ArenaGenerator
 from thirst_games.constants import AFTERNOON, MORNING, NIGHT, STARTER
-from thirst_games.context import Context, AbstractGame
+from thirst_games.context import AbstractGame
 from thirst_games.event import WildFire, DropEvent, Flood, AcidGas, Wasps, Beasts
+from thirst_games.event_log import PHASES, Verb
 from thirst_games.map import Map, START_AREA, Area
-from thirst_games.narrator import Narrator, format_list
+from thirst_games.narrator import format_list
 from thirst_games.player.group import Group
 from thirst_games.player.player import Player
-from thirst_games.singleton import Singleton
+from thirst_games.relationships import Relationships, SparseRelationships
+from thirst_games.world import World, child_seed
 
+logger = logging.getLogger(__name__)
 
-class Game(AbstractGame, metaclass=Singleton):
-    def __init__(self, players: Optional[List[Player]]=None):
+
+class Game(AbstractGame):
+    def __init__(
+            self, players: Optional[List[Player]]=None, world: Optional[World]=None,
+            arena: Optional[ArenaGenerator]=None, sparse_relationships=False,
+    ):
         if players is None:
             raise ValueError('No players in the arena')
-        Context().game = self
+        if world is None:
+            world = World()
+        self.world = world
+        self.narrator = world.narrator
+        self.context = world.context
+        self.rng = world.rng
+        self.context.game = self
         self.players = players
-        self.map = Map(len(players))
+        self._alive: Dict[Player, None] = dict.fromkeys(players)  # ordered set, updated on each death
+        if self.narrator.active:
+            self.narrator.write(f'INIT ARENA FOR {len(players)} PLAYERS')
+        self.arena = arena
+        self.sparse_relationships = sparse_relationships
+        self.map = world.map = Map(self.rng, len(players), arena)
         self._event_gauge = 0
         self._players_at_last_event = 0
         self._time_since_last_event = 0
-        for p in self.players:
+        if sparse_relationships:
+            # for big rosters: only pairs of a district are drawn, the others are derived from the seed
+            relationships = SparseRelationships(len(players), child_seed(world.seed, 'relationships'))
+        else:
+            relationships = Relationships(len(players))
+        self.relationships = world.relationships = relationships
+        for i, p in enumerate(self.players):
+            p.index = i
+            p.bind(world)
             self.map.add_player(p)
-            for p2 in self.players:
-                if p != p2:
-                    if p.district == p2.district:
-                        p.relationship(p2).add_friendship(random() * 0.5 + 0.5)
-                        p.relationship(p2).add_trust(random() * 0.5)
-                    else:
-                        p.relationship(p2).add_friendship(random())
-                        p.relationship(p2).add_trust(random() * 0.25)
+        self.relationships.seed(self.players, self.rng)
         self.event_classes = [WildFire, DropEvent, Flood, AcidGas, Wasps, Beasts]
         self.day = 0
+        self.death_order: List[str] = []
         self.time = STARTER
 
     @property
-    def alive_players(self):
-        return [p for p in self.players if p.is_alive]
+    def alive_players(self) -> KeysView[Player]:
+        # a read-only live view: copy it before a loop that can kill someone
+        return self._alive.keys()
+
+    @property
+    def player_count(self) -> int:
+        return len(self._alive)
 
     def all_players_at_start_are_allies(self):
         players = copy(self.map.get_area(START_AREA).players)
         player_one = players.pop()
         for p in players:
-            if not player_one.relationship(p).allied:
+            if not player_one.is_allied_to(p):
                 return False
         return True
 
@@ -57,32 +83,33 @@ class Game(AbstractGame, metaclass=Singleton):
         self._event_gauge = 0
         self._players_at_last_event = len(self.alive_players)
         self._time_since_last_event = 0
-        Narrator().new(f'== DAY {self.day} START ==')
-        Narrator().new(['All players start', self.map.get_area(START_AREA).at])
+        self.narrator.new(f'== DAY {self.day} START ==')
+        self.narrator.new(['All players start', self.map.get_area(START_AREA).at])
         self.time = STARTER
-        Context().forbidden_areas.append(self.map.get_area(START_AREA))
+        self.context.forbid([self.map.get_area(START_AREA)])
         rounds = 0
         while len(self.playing_entities_at(self.map.get_area(START_AREA))) > 1:
-            Narrator().tell()
+            self.narrator.tell()
             self.launch()
-            Narrator().tell(filters=[self.map.get_area(START_AREA).at])
-            Narrator().new(f'...')
+            self.narrator.tell(filters=[self.map.get_area(START_AREA).at])
+            self.narrator.new(f'...')
             if self.map.players_count(START_AREA) > 1:
-                Narrator().new([
-                    format_list([p.name for p in self.alive_players if p.current_area.is_start]),
-                    'remain',
-                    self.map.get_area(START_AREA).at
-                ])
+                if self.narrator.active:
+                    self.narrator.new([
+                        format_list([p.name for p in self.alive_players if p.current_area.is_start]),
+                        'remain',
+                        self.map.get_area(START_AREA).at
+                    ])
             elif self.map.players_count(START_AREA) == 1:
-                Narrator().new([
+                self.narrator.new([
                     'Only',
                     [p for p in self.alive_players if p.current_area.is_start][0].name,
                     'remains',
                     self.map.get_area(START_AREA).at
                 ])
-                Narrator().tell()
+                self.narrator.tell()
                 self.launch()
-                Narrator().tell(filters=[self.map.get_area(START_AREA).at])
+                self.narrator.tell(filters=[self.map.get_area(START_AREA).at])
             rounds += 1
             if rounds > 10:
                 raise Exception
@@ -94,71 +121,89 @@ class Game(AbstractGame, metaclass=Singleton):
                 self.launch()
             if len(self.alive_players) < 2:
                 break
-            Narrator().new(f'-- DAY {self.day} afternoon --')
+            self.narrator.new(f'-- DAY {self.day} afternoon --')
             self.time = AFTERNOON
             self.launch()
             if len(self.alive_players) < 2:
                 break
-            Narrator().new(f'-- NIGHT {self.day} --')
+            self.narrator.new(f'-- NIGHT {self.day} --')
             self.time = NIGHT
             self.launch()
             if len(self.alive_players) < 2:
                 break
-            Narrator().tell()
-            self.status()
+            self.narrator.tell()
+            if self.narrator.active:
+                self.status()
+            self.narrator.end_day()
             self.day += 1
-            Narrator().new(f'\n== DAY {self.day} morning ==')
+            self.narrator.new(f'\n== DAY {self.day} morning ==')
         if len(self.alive_players) == 1:
-            Narrator().tell()
-            print(f'{self.alive_players[0].name} wins the Hunger Games!')
+            self.narrator.record(Verb.WIN, next(iter(self.alive_players)))
+        if len(self.alive_players) == 1 and self.narrator.active:
+            self.narrator.tell()
+            self.narrator.write(f'{next(iter(self.alive_players)).name} wins the Hunger Games!')
+        self.narrator.flush()
+        if self.world.profiler is not None:
+            # logged rather than told: the sink only gets the story
+            logger.info(self.world.profiler.report())
 
     def launch(self):
-        Context().new_day()
+        self.context.phase = PHASES.index(self.time)
+        self.context.new_day()
         self.play()
+        self.narrator.end_phase()
 
     def play(self):
-        Narrator().cut()
+        self.narrator.cut()
         players: List[PlayingEntity] = []
-        for player in self.alive_players:
+        for player in list(self.alive_players):
             player.consider_betrayal()
         for area in self.map.areas:
             players.extend(self.playing_entities_at(area))
         if self.time != STARTER:
-            for p in self.alive_players:
+            for p in list(self.alive_players):
                 p.upkeep()
-        players.sort(key=lambda x: random())
+        players.sort(key=lambda x: self.rng.random())
         if self.check_for_event():
             self.trigger_event()
+        if self.world.profiler is not None:
+            self.world.profiler.start_phase(self.day, self.time)
+        self.world.policy.prepare(players)
         for i in range(len(players) + 2):
             if i < len(players) and players[i].is_alive:
                 if self.time != STARTER or players[i].current_area.is_start:
-                    players[i].think()
+                    self._think(players[i])
             if i - 2 >= 0 and players[i-2].is_alive:
                 if self.time != STARTER or players[i-2].current_area.is_start:
-                    players[i-2].act()
+                    self._act(players[i-2])
         for p in self.alive_players:
             p.busy = False
             p.acted = False
 
+    def _think(self, entity: PlayingEntity):
+        profiler = self.world.profiler
+        if profiler is None:
+            entity.think()
+            return
+        profiler.timed('think', type(entity).__name__, entity.think)
+        profiler.chose(entity.strategy)
+
+    def _act(self, entity: PlayingEntity):
+        profiler = self.world.profiler
+        if profiler is None:
+            entity.act()
+            return
+        profiler.timed('act', type(entity).__name__, entity.act)
+
     def playing_entities_at(self, area: Union[str, Area, Entity]) -> List[PlayingEntity]:
         area = self.map.get_area(area)
         players: List[PlayingEntity] = []
-        area_players = copy(area.players)
-        while area_players:
-            group = area_players[0].current_group()
+        for group in self.world.alliances.groups(area.players):
             if len(group) > 1:
-                players.append(Group(group))
+                # same order as Player.current_group(): the first one found comes last
+                players.append(Group([*group[1:], group[0]]))
             else:
                 players.append(group[0])
-            for player in group:
-                try:
-                    area_players.remove(player)
-                except ValueError as e:
-                    # print(f'all={[p.name for p in area.players]}')
-                    # print(f'taken={[[a.name for a in p.players] for p in players]} '
-                    #       f'remain={[p.name for p in area_players]}')
-                    # print(f'remove={[p.name for p in players[-1].players]} fail={player.name}')
-                    pass
         return players
 
     def status(self):
@@ -178,7 +223,7 @@ class Game(AbstractGame, metaclass=Singleton):
             max_l = 200 - len(status)
             if len(bag) > max_l:
                 bag = bag[:max_l-3] + '...'
-            print(status + bag)
+            self.narrator.write(status + bag)
 
     def check_for_event(self):
         if self.time == STARTER:
@@ -188,26 +233,43 @@ class Game(AbstractGame, metaclass=Singleton):
         return self._event_gauge > 0
 
     def trigger_event(self):
-        possible_events = [cls for cls in self.event_classes if cls.can_happen()]
+        possible_events = [cls for cls in self.event_classes if cls.can_happen(self.world)]
         if not len(possible_events):
             return
         self._event_gauge = 0
-        event = choice(possible_events)()
-        areas = format_list(list(set([f'the {area.name}' for area in event.areas])))
-        Narrator().new(['EVENT:', event.name.upper(), f'at {areas}'])
-        Narrator().new(['EVENT:', event.name.upper(), f'at {event.areas}'])
-        Narrator().cut()
+        event = self.rng.choice(possible_events)(self.world)
+        for area in event.areas:
+            self.narrator.record(Verb.ARENA_EVENT, area=area, weapon=event.name)
+        if self.narrator.active:
+            areas = format_list(list(set([f'the {area.name}' for area in event.areas])))
+            self.narrator.new(['EVENT:', event.name.upper(), f'at {areas}'])
+            self.narrator.new(['EVENT:', event.name.upper(), f'at {event.areas}'])
+            self.narrator.cut()
         event.trigger()
-        Narrator().new(' ')
-        Narrator().cut()
+        self.narrator.new(' ')
+        self.narrator.cut()
         self._players_at_last_event = len(self.alive_players)
         self._time_since_last_event = 0
 
+    def result(self) -> dict:
+        survivors = [p.name for p in self.alive_players]
+        return {
+            'winner': survivors[0] if len(survivors) == 1 else None,
+            'survivors': survivors,
+            'day': self.day,
+            'death_order': copy(self.death_order),
+            'kills': {p.name: p.kills for p in self.players},
+        }
+
     def death(self, dead_player):
+        self.narrator.record(Verb.DIE, dead_player, area=dead_player.current_area)
+        self.death_order.append(dead_player.name)
+        self._alive.pop(dead_player, None)
+        self.world.alliances.remove(dead_player)
         try:
             self.map.remove_player(dead_player)
         except ValueError as e:
-            Narrator().tell()
+            self.narrator.tell()
             raise ValueError(
                 f'{dead_player.name} has {dead_player.health}hp, is_alive={dead_player.is_alive}, '
                 f'is_in_players={dead_player in self.alive_players}'
@@ -1,6 +1,7 @@
-from typing import List, Union, Optional
+import logging
+from typing import Dict, List, Union, Optional
 
-from random import random, choice, randint
+from random import Random
 
 from thirst_games.abstract.entity import Entity, AbstractTrap, CarryingEntity
 from thirst_games.abstract.items import Weapon, Item, Bag, Bottle, PoisonVial
@@ -8,7 +9,8 @@ from thirst_games.abstract.area import Area, _nature
 from thirst_games.abstract.playing_entity import PlayingEntity
 from thirst_games.constants import KNIFE, HATCHET, TRIDENT, AXE, SWORD, MACE, START_AREA, MACHETE
 from thirst_games.poison import Poison, Food
-from thirst_games.singleton import Singleton
+
+logger = logging.getLogger(__name__)
 
 food_values = {
     'roots': 0.3,
@@ -20,39 +22,39 @@ food_values = {
 }
 
 
-def random_bag() -> Bag:
+def random_bag(rng: Random) -> Bag:
     elements = []
-    for i in range(1 + randint(0, 2) + randint(0, 2)):
-        elements.append(Food(choice(['ration', 'food can', 'energy bar']), 0.5 + random() / 2))
-    if random() > 0.3:
+    for i in range(1 + rng.randint(0, 2) + rng.randint(0, 2)):
+        elements.append(Food(rng.choice(['ration', 'food can', 'energy bar']), 0.5 + rng.random() / 2, rng))
+    if rng.random() > 0.3:
         elements.append(Item('rope'))
-    if random() > 0.2:
-        for i in range(randint(1, 4)):
+    if rng.random() > 0.2:
+        for i in range(rng.randint(1, 4)):
             elements.append(Item('bandages'))
-    if random() > 0.2:
-        for i in range(randint(1, 4)):
+    if rng.random() > 0.2:
+        for i in range(rng.randint(1, 4)):
             elements.append(Item('iodine'))
-    if random() > 0.7:
+    if rng.random() > 0.7:
         elements.append(Item('net'))
-    if random() > 0.7:
+    if rng.random() > 0.7:
         elements.append(Item('wire'))
-    if random() > 0.6:
+    if rng.random() > 0.6:
         elements.append(Item('antidote'))
-    if random() > 0.9:
-        elements.append(PoisonVial(Poison('poison', randint(3, 6), random() * 0.2 + 0.1)))
-    if random() > 0.2:
-        elements.append(Bottle(float(random() > 0.5)))
-    if random() > 0.8:
-        for i in range(randint(1, 3)):
+    if rng.random() > 0.9:
+        elements.append(PoisonVial(Poison('poison', rng.randint(3, 6), rng.random() * 0.2 + 0.1)))
+    if rng.random() > 0.2:
+        elements.append(Bottle(float(rng.random() > 0.5)))
+    if rng.random() > 0.8:
+        for i in range(rng.randint(1, 3)):
             elements.append(Item('explosive'))
-    if random() > 1/3:
-        elements.append(Weapon(HATCHET, 1 + random()))
-    elif random() > 0.5:
-        elements.append(Weapon(KNIFE, 1 + random()))
+    if rng.random() > 1/3:
+        elements.append(Weapon(HATCHET, 1 + rng.random()))
+    elif rng.random() > 0.5:
+        elements.append(Weapon(KNIFE, 1 + rng.random()))
     return Bag(elements)
 
 
-def random_weapon() -> Weapon:
+def random_weapon(rng: Random) -> Weapon:
     potential_weapons = {
         (SWORD, 2.5): 1,
         (AXE, 2.5): 1,
@@ -63,103 +65,130 @@ def random_weapon() -> Weapon:
     }
     total = sum(potential_weapons.values())
     potential_weapons = {key: value / total for key, value in potential_weapons.items()}
-    pick = random()
+    pick = rng.random()
     for key, value in potential_weapons.items():
         if pick < value:
             name, power = key
-            return Weapon(name, power + random())
+            return Weapon(name, power + rng.random())
         pick -= value
     raise ValueError
 
 
-class Map(metaclass=Singleton):
+class Map:
+
+    def __init__(self, rng: Random, player_amount=24, arena=None) -> None:
+        # without an arena generator, the legacy arena: a few area types, up to four areas each
+        self.rng = rng
+        self.areas: List[Area] = []
+        self._areas_by_name: Dict[str, List[Area]] = {}
+        self._index: Dict[str, Area] = {}  # name -> first area of that name, full name -> area
+        self._arrivals: Dict[Entity, int] = {}  # player -> when it entered its area, see arrival
+        self._clock = 0
+        if arena is None:
+            self._build_arena(player_amount)
+        else:
+            arena.build(self, player_amount)
+        self.test = ''
 
-    def __init__(self, player_amount=24) -> None:
-        print(f'INIT ARENA FOR {player_amount} PLAYERS')
+    def _build_arena(self, player_amount):
         possible_parts_names = list(_nature.keys())
         possible_parts_names.remove(START_AREA)
-        possible_parts_names.sort(key=lambda x: random())
+        possible_parts_names.sort(key=lambda x: self.rng.random())
         size = player_amount // 4 + 1
         possible_parts_names = possible_parts_names[:size-1]
-        self.areas: List[Area] = []
         for area_name in possible_parts_names:
-            for i in range(randint(1, 4)):
-                self.areas.append(Area(area_name))
-        start_area = Area(START_AREA)
-        self.areas.append(start_area)
+            for i in range(self.rng.randint(1, 4)):
+                self.add_area(area_name)
+        self.stock_cornucopia(self.add_area(START_AREA), player_amount)
 
+    def stock_cornucopia(self, start_area: Area, player_amount):
         for i in range(player_amount // 2):
-            start_area.loot.append(random_weapon())
+            start_area.loot.append(random_weapon(self.rng))
         for i in range(5):
-            start_area.loot.append(random_bag())
+            start_area.loot.append(random_bag(self.rng))
 
-        self.test = ''
+    def add_area(self, name: str) -> Area:
+        same_name = self._areas_by_name.setdefault(name, [])
+        area = Area(name, len(same_name), len(self.areas))
+        same_name.append(area)
+        self.areas.append(area)
+        self._index.setdefault(name, area)
+        self._index[area.full_name] = area
+        return area
+
+    def areas_named(self, name: str) -> List[Area]:
+        return self._areas_by_name.get(name, [])
 
     @property
     def area_names(self) -> List[str]:
         return [area.name for area in self.areas]
 
-    def get_area(self, area: Union[str, Area, Entity]) -> Area:
+    def get_area(self, area: Union[int, str, Area, Entity]) -> Area:
+        # an int is the area's index, a name gives the first area of that name, a full name like forest[2] is exact
+        if isinstance(area, Area):
+            return area
         if isinstance(area, Entity):
             return area.current_area
         if isinstance(area, str):
             try:
-                return [a for a in self.areas if a.name == area][0]
-            except IndexError as e:
+                return self._index[area]
+            except KeyError as e:
                 raise IndexError(f'no {area} in {self.areas}') from e
-        if isinstance(area, Area):
-            return area
-        raise ValueError(f'{area} is neither a string or a positionable')
+        if isinstance(area, int):
+            if not 0 <= area < len(self.areas):
+                raise IndexError(f'no area #{area} in {self.areas}')
+            return self.areas[area]
+        raise ValueError(f'{area} is neither an index, a string or a positionable')
 
-    def loot(self, area: Union[str, Area, Entity]) -> List[Item]:
+    def loot(self, area: Union[int, str, Area, Entity]) -> List[Item]:
         return self.get_area(area).loot
 
-    def has_loot(self, area: Union[str, Area, Entity]) -> bool:
+    def has_loot(self, area: Union[int, str, Area, Entity]) -> bool:
         return len(self.loot(area)) > 0
 
-    def forage_potential(self, area: Union[str, Area, Entity]) -> float:
+    def forage_potential(self, area: Union[int, str, Area, Entity]) -> float:
         foods = self.get_area(area).foods
         if len(foods):
             return max([food_values[name] for name in foods])
         return 0
 
-    def get_forage(self, area: Union[str, Area, Entity]) -> Optional[Food]:
+    def get_forage(self, area: Union[int, str, Area, Entity]) -> Optional[Food]:
         foods = self.get_area(area).foods
         if not len(foods):
             return None
-        food_name = choice(foods)
-        return Food(food_name, random() * food_values[food_name])
+        food_name = self.rng.choice(foods)
+        return Food(food_name, self.rng.random() * food_values[food_name], self.rng)
 
-    def weapons(self, area: Union[str, Area, Entity]) -> List[Weapon]:
+    def weapons(self, area: Union[int, str, Area, Entity]) -> List[Weapon]:
         return [e for e in self.loot(area) if isinstance(e, Weapon)]
 
-    def has_weapons(self, area: Union[str, Area, Entity]) -> bool:
+    def has_weapons(self, area: Union[int, str, Area, Entity]) -> bool:
         return len(self.weapons(area)) > 0
 
-    def pick_weapon(self, area: Union[str, Area, Entity]) -> Optional[Weapon]:
+    def pick_weapon(self, area: Union[int, str, Area, Entity]) -> Optional[Weapon]:
         if not self.has_weapons(area):
             return None
-        w = choice(self.weapons(area))
+        w = self.rng.choice(self.weapons(area))
         self.remove_loot(w, area)
         return w
 
-    def bags(self, area: Union[str, Area, Entity]) -> List[Bag]:
+    def bags(self, area: Union[int, str, Area, Entity]) -> List[Bag]:
         return [e for e in self.loot(area) if isinstance(e, Bag)]
 
-    def has_bags(self, area: Union[str, Area, Entity]) -> bool:
+    def has_bags(self, area: Union[int, str, Area, Entity]) -> bool:
         return len(self.bags(area)) > 0
 
-    def pick_bag(self, area: Union[str, Area, Entity]) -> Optional[Bag]:
+    def pick_bag(self, area: Union[int, str, Area, Entity]) -> Optional[Bag]:
         if not self.has_bags(area):
             return None
-        b = choice(self.bags(area))
+        b = self.rng.choice(self.bags(area))
         self.remove_loot(b, area)
         return b
 
-    def pick_item(self, area: Union[str, Area, Entity]):
+    def pick_item(self, area: Union[int, str, Area, Entity]):
         if not self.has_loot(area):
             return None
-        i = choice(self.loot(area))
+        i = self.rng.choice(self.loot(area))
         self.remove_loot(i, area)
         return i
 
@@ -168,33 +197,42 @@ class Map(metaclass=Singleton):
             return None
         best_value = max([player.estimate(i) for i in self.loot(player)])
         picks = [i for i in self.loot(player) if player.estimate(i) == best_value]
-        i = choice(picks)
+        i = self.rng.choice(picks)
         self.remove_loot(i, player)
         return i
 
-    def remove_loot(self, item: Item, area: Union[str, Area, Entity]):
+    def remove_loot(self, item: Item, area: Union[int, str, Area, Entity]):
         try:
             self.get_area(area).loot.remove(item)
         except ValueError as e:
-            print(f'WARNING: tried to remove {item.long_name} from loot at {area} but couldn\'t')
+            logger.warning(f'tried to remove {item.long_name} from loot at {area} but couldn\'t')
+        self.loot_changed(area)
 
-    def add_loot(self, item: Item, area: Union[str, Area, Entity]):
+    def add_loot(self, item: Item, area: Union[int, str, Area, Entity]):
         self.get_area(area).loot.append(item)
+        self.loot_changed(area)
 
-    def add_player(self, player: Entity, destination: Union[str, Area, Entity]=START_AREA):
+    def loot_changed(self, area: Union[int, str, Area, Entity]):
+        # the courage of the players there depends on the loot in sight
+        for p in self.get_area(area).players:
+            p.stats_changed()
+
+    def add_player(self, player: Entity, destination: Union[int, str, Area, Entity]=START_AREA):
         area = self.get_area(destination)
         player.move_to(area)
         area.players.append(player)
+        self._clock += 1
+        self._arrivals[player] = self._clock
 
     def remove_player(self, player: Entity):
         try:
             player.current_area.players.remove(player)
         except ValueError as e:
             for area in self.areas:
-                print(f'{area.name}: {[p.name for p in area.players]}')
+                logger.error(f'{area.name}: {[p.name for p in area.players]}')
             raise e
 
-    def move_player(self, player, destination: Union[str, Area, Entity]) -> Optional[Area]:
+    def move_player(self, player, destination: Union[int, str, Area, Entity]) -> Optional[Area]:
         new_area = self.get_area(destination)
         # Narrator().new([player.current_area.name, '->', player.name, '->', new_area.name])
         if player.current_area == new_area:
@@ -203,38 +241,41 @@ class Map(metaclass=Singleton):
         self.add_player(player, destination)
         return new_area
 
-    def add_trap(self, trap: Entity, area: Union[str, Area, Entity]=START_AREA):
+    def add_trap(self, trap: Entity, area: Union[int, str, Area, Entity]=START_AREA):
         area = self.get_area(area)
         trap.move_to(area)
-        trap.map = self
         area.traps.append(trap)
 
     def remove_trap(self, trap: Entity):
         trap.current_area.traps.remove(trap)
 
-    def players_count(self, area: Union[str, Area, Entity]) -> int:
+    def players_count(self, area: Union[int, str, Area, Entity]) -> int:
         v = len(self.players(area))
         if not v and isinstance(area, Entity):
-            print(f'Warning: {area.name} not in {area.current_area}? {area.current_area.players}')
+            logger.warning(f'{area.name} not in {area.current_area}? {area.current_area.players}')
         return v
 
-    def players(self, area: Union[str, Area, Entity]) -> List[PlayingEntity]:
+    def arrival(self, player: Entity) -> int:
+        # the players of an area are listed by arrival: sorting a few of them on it gives the area's order
+        return self._arrivals[player]
+
+    def players(self, area: Union[int, str, Area, Entity]) -> List[PlayingEntity]:
         return self.get_area(area).players
 
-    def potential_players(self, area: Union[str, Area, Entity]) -> List[PlayingEntity]:
-        area = self.get_area(area)
-        return [p for a in self.areas for p in a.players if p.current_area == area or p.destination == area]
+    def potential_players(self, area: Union[int, str, Area, Entity]) -> List[PlayingEntity]:
+        # no strategy announces a destination before moving, so these are the players already there
+        return list(self.get_area(area).players)
 
-    def traps(self, area: Union[str, Area, Entity]) -> List[AbstractTrap]:
+    def traps(self, area: Union[int, str, Area, Entity]) -> List[AbstractTrap]:
         return self.get_area(area).traps
 
-    def has_water(self, area: Union[str, Area, Entity]) -> bool:
+    def has_water(self, area: Union[int, str, Area, Entity]) -> bool:
         return self.get_area(area).has_water
 
-    def ambushers(self, area: Union[str, Area, Entity]):
+    def ambushers(self, area: Union[int, str, Area, Entity]):
         return self.get_area(area).ambushers
 
-    def add_ambusher(self, ambusher: PlayingEntity, area: Union[str, Area, Entity]):
+    def add_ambusher(self, ambusher: PlayingEntity, area: Union[int, str, Area, Entity]):
         area_ambushers = self.get_area(area).ambushers
         if ambusher not in area_ambushers:
             for p in ambusher.players:
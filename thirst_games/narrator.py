@@ -1,41 +1,58 @@
-from random import choice
-from typing import List, Optional, Tuple
+import sys
+from collections import Counter, deque
+from functools import lru_cache
+from random import Random
+from typing import Deque, List, Optional, TextIO, Tuple
 
-from thirst_games.singleton import Singleton
+from thirst_games.event_log import EventLog, Verb
 from thirst_games.weapons import weapon_kill_word
 
 
+# when the buffered output is written to the sink
+EVERY_LINE = 'line'
+EVERY_PHASE = 'phase'
+EVERY_DAY = 'day'
+
+
 def format_list(names: List[str]):
     if not len(names):
         return ''
-    names = [str(n) for n in names]
-    unique_names = list(set(names))
-    unique_names.sort()
-    amount_by_name = {name: names.count(name) for name in unique_names}
-    counted_names = [
+    return _format_names(tuple(str(n) for n in names))
+
+
+@lru_cache(maxsize=1024)
+def _format_names(names: Tuple[str, ...]) -> str:
+    # the same allies and bag contents are formatted over and over during a game
+    amount_by_name = Counter(names)
+    names = [
         (
-            '' if amount_by_name[name] == 1 else str(amount_by_name[name]) + ' '
+            '' if amount == 1 else str(amount) + ' '
         ) + name + (
-            's' if amount_by_name[name] > 1 and name[-1] not in ['s', ']'] else ''
-        ) for name in unique_names
+            's' if amount > 1 and name[-1] not in ['s', ']'] else ''
+        ) for name, amount in sorted(amount_by_name.items())
     ]
-    names = counted_names
 
     if len(names) == 1:
         return names[0]
-    out = ''
-    for i in range(len(names) - 2):
-        out += names[i] + ', '
-    out += names[-2] + ' and ' + names[-1]
-    return out
+    return ', '.join(names[:-1]) + ' and ' + names[-1]
 
 
-class Narrator(metaclass=Singleton):
-    def __init__(self) -> None:
+class Narrator:
+    active = True
+
+    def __init__(
+            self, rng: Random, log: Optional[EventLog]=None, sink: Optional[TextIO]=None, flush_every=EVERY_LINE,
+    ) -> None:
+        self.rng = rng
+        self.log = log  # typed records of what happens when the world records them, see record()
+        self.sink = sink  # any file-like object, None for the current sys.stdout
+        self.flush_every = flush_every
+        self._buffer: List[str] = []  # told lines not written to the sink yet
         self.current_sentence: List[str] = []
+        self._phrases = Counter()  # phrase -> occurrences in current_sentence, to avoid repetitions without a scan
         self.active_subject = None
         self._used_verbs = {}
-        self.text: List[List[str]] = []
+        self.text: Deque[List[str]] = deque()
         self._stock: List[Tuple(str, int)] = []
         self._switch = {
             'at the ruins': 'in the ruins',
@@ -57,7 +74,7 @@ class Narrator(metaclass=Singleton):
             if len(tools) == 1:
                 tool = tools[0]
                 if tool in weapon_kill_word:
-                    return choice(weapon_kill_word[tool])
+                    return self.rng.choice(weapon_kill_word[tool])
         return phrase
 
     def tell(self, filters: Optional[List[str]]=None):
@@ -66,7 +83,7 @@ class Narrator(metaclass=Singleton):
         filters.append('')
         self.cut()
         while len(self.text):
-            line = self.text.pop(0)
+            line = self.text.popleft()
             if not len(line):
                 continue
             line_str = ''
@@ -81,7 +98,26 @@ class Narrator(metaclass=Singleton):
                 line_str = line_str[:-1] + '.'
             # if len(line_str.split('misses')) > 2:
             #     continue
-            print(line_str)
+            self.write(line_str)
+
+    def write(self, line: str):
+        self._buffer.append(line)
+        if self.flush_every == EVERY_LINE:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            sink = sys.stdout if self.sink is None else self.sink
+            sink.write('\n'.join(self._buffer) + '\n')
+            self._buffer.clear()
+
+    def end_phase(self):
+        if self.flush_every == EVERY_PHASE:
+            self.flush()
+
+    def end_day(self):
+        if self.flush_every in (EVERY_PHASE, EVERY_DAY):
+            self.flush()
 
     def _add(self, sentence):
         if isinstance(sentence, list) and len(sentence):
@@ -96,14 +132,14 @@ class Narrator(metaclass=Singleton):
 
             # avoid repetition of tool
             tool = [e for e in sentence if e.startswith('with')]
-            if tool and (tool[0] in self.current_sentence
-                         or tool[0].replace('his', 'her') in self.current_sentence
-                         or tool[0].replace('her', 'his') in self.current_sentence):
+            if tool and (self._phrases[tool[0]]
+                         or self._phrases[tool[0].replace('his', 'her')]
+                         or self._phrases[tool[0].replace('her', 'his')]):
                 sentence.remove(tool[0])
 
             # avoid repetition of place
             place = [e for e in sentence if e.startswith('at') and len(e) > 6]
-            if place and place[0] in self.current_sentence:
+            if place and self._phrases[place[0]]:
                 sentence.remove(place[0])
 
             # avoid repetition of verb
@@ -114,8 +150,10 @@ class Narrator(metaclass=Singleton):
                     self._used_verbs[sentence[1]] = self.active_subject
 
             self.current_sentence.extend(sentence)
+            self._phrases.update(sentence)
         elif isinstance(sentence, str):
             self.current_sentence.append(sentence)
+            self._phrases[sentence] += 1
 
     def add(self, sentence, stock=False):
         if stock:
@@ -128,11 +166,13 @@ class Narrator(metaclass=Singleton):
                 and len(self.current_sentence[-1]) \
                 and self.current_sentence[-1][-1] not in ['!', '.', ',']:
             self.current_sentence.append(',')
+            self._phrases[','] += 1
 
     def cut(self):
         if len(self.current_sentence):
             self.text.append(self.current_sentence)
         self.current_sentence = []
+        self._phrases = Counter()
         self._used_verbs = {}
         self.active_subject = None
 
@@ -141,12 +181,16 @@ class Narrator(metaclass=Singleton):
         self.add(sentence)
 
     def replace(self, old, new):
+        if not self._phrases[old]:
+            return
         for i in range(len(self.current_sentence)):
             if self.current_sentence[i] == old:
                 self.current_sentence[i] = new
+        self._phrases[new] += self._phrases.pop(old)
 
     def remove(self, to_remove):
         self.current_sentence.remove(to_remove)
+        self._phrases[to_remove] -= 1
 
     def stock(self, to_stock):
         self._stock.append(to_stock)
@@ -156,9 +200,52 @@ class Narrator(metaclass=Singleton):
             self._add(s)
         self.clear_stock()
 
+    def record(self, verb: Verb, actor=None, target=None, area=None, weapon: str=''):
+        # unlike the prose, records are kept in headless games too, when the world records them
+        if self.log is not None:
+            self.log.record(verb, actor, target, area, weapon)
+
     def clear_stock(self):
         self._stock.clear()
 
     @property
     def has_stock(self):
         return len(self._stock) > 0
+
+
+class SilentNarrator(Narrator):
+    # headless games: nothing is kept or told, and call sites check `active` to skip building sentences
+    active = False
+
+    def tell(self, filters: Optional[List[str]]=None):
+        pass
+
+    def write(self, line: str):
+        pass
+
+    def flush(self):
+        pass
+
+    def add(self, sentence, stock=False):
+        pass
+
+    def new(self, sentence):
+        pass
+
+    def cut(self):
+        pass
+
+    def comma(self):
+        pass
+
+    def replace(self, old, new):
+        pass
+
+    def remove(self, to_remove):
+        pass
+
+    def stock(self, to_stock):
+        pass
+
+    def apply_stock(self):
+        pass
@@ -1,19 +1,25 @@
-from random import random, choice
+import logging
 from typing import List
 
-from thirst_games.abstract.entity import LivingEntity, Entity
+from thirst_games.abstract.entity import LivingEntity, Entity, TrackedList, derived_stat, tracked
 from thirst_games.constants import (
     HEAD_WOUND, BELLY_WOUND, LEG_WOUND, BLEEDING, SLEEPING, THIRSTY, TRAPPED,
     NIGHT, AMBUSH, FLEEING, BURN_WOUND,
     START_AREA)
-from thirst_games.context import Context
-from thirst_games.map import Map
-from thirst_games.narrator import Narrator, format_list
+from thirst_games.narrator import format_list
 from thirst_games.poison import Poison
 from thirst_games.weapons import get_weapon_wound, get_weapon_blood
 
+logger = logging.getLogger(__name__)
+
 
 class Body(LivingEntity):
+    _health = tracked('_health')
+    _max_health = tracked('_max_health')
+    _energy = tracked('_energy')
+    _stomach = tracked('_stomach')
+    _water = tracked('_water')
+    _rage = tracked('_rage')
 
     def __init__(self, name: str, he):
         LivingEntity.__init__(self, name, he)
@@ -24,7 +30,8 @@ class Body(LivingEntity):
         self._stomach = 1
         self._water = 2
         self._rage = 0
-        self._poisons: List[Poison] = []
+        self._poisons: List[Poison] = TrackedList(self)
+        self.destination = None
 
     @property
     def is_alive(self):
@@ -34,7 +41,7 @@ class Body(LivingEntity):
     def health(self):
         return max(0, self._health)
 
-    @property
+    @derived_stat
     def max_health(self):
         max_hp = self._max_health
         if BELLY_WOUND in self.status:
@@ -47,11 +54,12 @@ class Body(LivingEntity):
         if self._health <= 0 and was_alive:
             self.die()
 
-    @property
+    @derived_stat
     def wounds(self):
-        wounds = [w for w in self.status if w.find('wound') != -1]
+        # a tuple: the memoized value is shared by every reader
+        wounds = tuple(w for w in self.status if w.find('wound') != -1)
         if BLEEDING in self.status:
-            wounds.append(BLEEDING)
+            wounds += (BLEEDING,)
         return wounds
 
     @property
@@ -66,14 +74,14 @@ class Body(LivingEntity):
 
         if self._energy < 0 and self.is_alive:
             if 'exhausted' not in self.status:
-                # Narrator().add([self.name, 'needs', 'to rest'])
+                # self.narrator.add([self.name, 'needs', 'to rest'])
                 self.status.append('exhausted')
             if self.stomach > 0:
                 self.consume_nutriments(self._energy)
             elif self.sleep <= 0:
                 self.add_health(self._energy)
                 if not self.is_alive:
-                    Narrator().add([self.name, 'dies', 'of hunger and exhaustion'])
+                    self.narrator.add([self.name, 'dies', 'of hunger and exhaustion'])
                 self._energy = 0
         else:
             if 'exhausted' in self.status:
@@ -87,7 +95,7 @@ class Body(LivingEntity):
         self._sleep = min(1, self._sleep + amount)
         if self._sleep < 0:
             if 'sleepy' not in self.status:
-                # Narrator().add([self.name, 'needs', 'to sleep'])
+                # self.narrator.add([self.name, 'needs', 'to sleep'])
                 self.status.append('sleepy')
             self.add_energy(self._sleep)
             self._sleep = 0
@@ -107,7 +115,7 @@ class Body(LivingEntity):
         self._stomach += value
         if self._stomach < 0:
             if 'hungry' not in self.status:
-                # Narrator().add([self.name, 'needs', 'to eat'])
+                # self.narrator.add([self.name, 'needs', 'to eat'])
                 self.status.append('hungry')
             self.add_energy(self._stomach)
             self._stomach = 0
@@ -130,7 +138,7 @@ class Body(LivingEntity):
         if self.water and 'thirsty' in self.status:
             self.status.remove('thirsty')
 
-    @property
+    @derived_stat
     def move_cost(self):
         cost = 0.3
         if LEG_WOUND in self.status:
@@ -138,8 +146,8 @@ class Body(LivingEntity):
         return cost
 
     def can_flee(self):
-        filtered_areas = Context().forbidden_areas
-        accessible_areas = [a for a in Map().areas if a not in filtered_areas]
+        filtered_areas = self.context.forbidden_areas
+        accessible_areas = [a for a in self.map.areas if a not in filtered_areas]
         if not len(accessible_areas):
             return False
         if TRAPPED in self.status:
@@ -151,28 +159,28 @@ class Body(LivingEntity):
 
     def rest(self, stock=False):
         if self.current_area.name != START_AREA:
-            self.stealth += random() * (1 - self.stealth)
-            Narrator().add([self.name, 'hides', self.current_area.at], stock=stock)
+            self.stealth += self.rng.random() * (1 - self.stealth)
+            self.narrator.add([self.name, 'hides', self.current_area.at], stock=stock)
 
         self.take_a_break()
         wounds = self.wounds
         if BLEEDING in wounds:
             self.patch(BLEEDING, stock=stock)
         elif len(wounds):
-            self.patch(choice(wounds), stock=stock)
+            self.patch(self.rng.choice(wounds), stock=stock)
         else:
-            self.add_health(max(self.energy, random()) * (self.max_health - self.health))
-            self.add_energy(max(self.sleep, random()) * (1 - self.energy))
-            Narrator().add([self.name, 'rests', self.current_area.at], stock=stock)
+            self.add_health(max(self.energy, self.rng.random()) * (self.max_health - self.health))
+            self.add_energy(max(self.sleep, self.rng.random()) * (1 - self.energy))
+            self.narrator.add([self.name, 'rests', self.current_area.at], stock=stock)
 
     def hide(self, panic=False, stock=False):
         if panic:
-            Narrator().add([self.name, 'hides', self.current_area.at], stock=stock)
+            self.narrator.add([self.name, 'hides', self.current_area.at], stock=stock)
             return
         if self.sleep < 0.1 \
-                or (Context().time == NIGHT and Map().players_count == 1 and len(self.wounds) == 0) \
-                or (Map().players_count == 1 and self.sleep < 0.2 and len(self.wounds) == 0) \
-                or (Context().time == NIGHT and self.sleep < 0.3 and len(self.wounds) == 0):
+                or (self.context.time == NIGHT and self.map.players_count == 1 and len(self.wounds) == 0) \
+                or (self.map.players_count == 1 and self.sleep < 0.2 and len(self.wounds) == 0) \
+                or (self.context.time == NIGHT and self.sleep < 0.3 and len(self.wounds) == 0):
             self.go_to_sleep(stock=stock)
             return
         return self.rest(stock=stock)
@@ -184,19 +192,19 @@ class Body(LivingEntity):
     def end_ambush(self):
         if AMBUSH in self.status:
             self.status.remove(AMBUSH)
-            Map().remove_ambusher(self)
+            self.map.remove_ambusher(self)
 
     def patch(self, wound: str, stock=False):
         raise NotImplementedError
 
     def go_to_sleep(self, stock=False):
         if self.energy < 0.2:
-            Narrator().add([self.name, 'is exhausted'], stock=stock)
+            self.narrator.add([self.name, 'is exhausted'], stock=stock)
         self.add_health(self.energy * (1 - self.health))
         self.add_energy(self.sleep * (1 - self.energy))
         self.add_sleep(1)
         verb = 'sleeps' if self.energy > 0 else 'collapses'
-        Narrator().add([self.name, verb, self.current_area.at], stock=stock)
+        self.narrator.add([self.name, verb, self.current_area.at], stock=stock)
         self.status.append(SLEEPING)
 
     def wake_up(self):
@@ -213,7 +221,8 @@ class Body(LivingEntity):
 
     def remove_poison(self, poison):
         poison.amount = 0
-        Narrator().add([self.name, 'is', 'no longer affected by', poison.long_name])
+        self.stats_changed()
+        self.narrator.add([self.name, 'is', 'no longer affected by', poison.long_name])
 
     def add_poison(self, poison):
         self._poisons.append(poison)
@@ -221,7 +230,7 @@ class Body(LivingEntity):
     def free_from_trap(self):
         if TRAPPED in self.status:
             self.status.remove(TRAPPED)
-            Narrator().new([self.name, 'frees', f'{self.him}self', 'from', 'the trap'])
+            self.narrator.new([self.name, 'frees', f'{self.him}self', 'from', 'the trap'])
 
     def upkeep(self):
         self.destination = None
@@ -230,9 +239,9 @@ class Body(LivingEntity):
         dehydratation = 0.5 if BURN_WOUND in self.status else 0.3
         self._water -= dehydratation
         self.water_upkeep()
-        energy_upkeep = -random() * 0.1  # loses energy while being awake
-        sleep_upkeep = max(random(), random()) * 0.1
-        food_upkeep = max(random(), random()) * 0.2
+        energy_upkeep = -self.rng.random() * 0.1  # loses energy while being awake
+        sleep_upkeep = max(self.rng.random(), self.rng.random()) * 0.1
+        food_upkeep = max(self.rng.random(), self.rng.random()) * 0.2
         if self.thirst > 1:
             self.status.append(THIRSTY)
             energy_upkeep *= self.thirst
@@ -249,50 +258,51 @@ class Body(LivingEntity):
 
         if BLEEDING in self.status:
             if self.be_damaged(max(0.05, self.health / 5)):
-                Narrator().add([self.name, 'bleeds', 'to death'])
+                self.narrator.add([self.name, 'bleeds', 'to death'])
         for poison in self.active_poisons:
             poison.upkeep(self)
         self._rage = 0
 
     def be_damaged(self, damage, weapon='default', attacker_name=None) -> bool:
-        self._rage += random() / 4 - damage
+        self._rage += self.rng.random() / 4 - damage
         if not self.is_alive:
-            print(f'{self.name} is already dead')
+            if self.narrator.active:
+                logger.warning(f'{self.name} is already dead')
             return False
         self.add_health(-damage)
         if self.is_alive and damage > 0.3:
-            wound_element = get_weapon_wound(weapon)
-            bleeding = get_weapon_blood(weapon)
+            wound_element = get_weapon_wound(weapon, self.rng)
+            bleeding = get_weapon_blood(weapon, self.rng)
             wound = wound_element + ' wound' if wound_element is not None else None
             if wound is not None and bleeding:
                 self.status.append(wound)
                 self.status.append(BLEEDING)
                 if attacker_name is None:
-                    Narrator().stock([
+                    self.narrator.stock([
                         self.name, 'suffers', 'a bleeding', wound])
                 else:
-                    Narrator().stock([attacker_name, 'wounds', self.him, 'deeply', 'at the', wound_element])
+                    self.narrator.stock([attacker_name, 'wounds', self.him, 'deeply', 'at the', wound_element])
             elif wound is not None:
                 self.status.append(wound)
                 if attacker_name is None:
-                    Narrator().stock([
+                    self.narrator.stock([
                         self.name, 'suffers', 'an' if wound[0] in ['a', 'e', 'i', 'o', 'u', 'y'] else 'a', wound])
                 else:
-                    Narrator().stock([attacker_name, 'wounds', self.him, 'at the', wound_element])
+                    self.narrator.stock([attacker_name, 'wounds', self.him, 'at the', wound_element])
             elif bleeding:
                 self.status.append(BLEEDING)
                 if attacker_name is None:
-                    Narrator().stock([
+                    self.narrator.stock([
                         self.name, 'suffers', 'a bleeding wound'])
                 else:
-                    Narrator().stock([attacker_name, 'wounds', self.him, 'deeply'])
+                    self.narrator.stock([attacker_name, 'wounds', self.him, 'deeply'])
             if wound is not None:
                 self._max_health *= 0.9
 
         return not self.is_alive
 
     def die(self):
-        Context().death(self)
+        self.context.death(self)
 
     @property
     def drops(self):
@@ -1,19 +1,19 @@
 from typing import List, Optional, Union
 
 from copy import copy
-from random import choice, random
 
-from thirst_games.abstract.entity import CarryingEntity
+from thirst_games.abstract.entity import CarryingEntity, tracked
 from thirst_games.abstract.items import Bag, Item, Weapon, Bottle, HANDS
-from thirst_games.constants import KNIFE, HATCHET, BLEEDING, STARTER, SWORD, AXE
-from thirst_games.context import Context
-from thirst_games.map import START_AREA, Map
-from thirst_games.narrator import format_list, Narrator
+from thirst_games.constants import KNIFE, HATCHET, BLEEDING, STARTER, SWORD, AXE, START_AREA
+from thirst_games.event_log import Verb
+from thirst_games.narrator import format_list
 from thirst_games.player.body import Body
 from thirst_games.poison import Food
 
 
 class Carrier(Body, CarryingEntity):
+    _weapon = tracked('_weapon')
+
     def __init__(self, name, his) -> None:
         Body.__init__(self, name, his)
         self._equipment: List[Item] = []
@@ -68,17 +68,18 @@ class Carrier(Body, CarryingEntity):
             bags = [e for e in self._equipment if isinstance(e, Bag)]
             if not len(bags):
                 return
-            stuff = [e.name for bag in bags for e in bag.content]
-            if len(stuff):
-                Narrator().new([
-                    self.name, 'checks', self.his, 'bags,' if len(bags) > 1 else 'bag,',
-                    'finds', format_list(stuff)])
-                Narrator().cut()
-            else:
-                Narrator().new([
-                    self.name, 'checks', self.his, 'bags,' if len(bags) > 1 else 'bag,',
-                    'finds', 'they are' if len(bags) > 1 else 'it is', 'empty'])
-                Narrator().cut()
+            if self.narrator.active:
+                stuff = [e.name for bag in bags for e in bag.content]
+                if len(stuff):
+                    self.narrator.new([
+                        self.name, 'checks', self.his, 'bags,' if len(bags) > 1 else 'bag,',
+                        'finds', format_list(stuff)])
+                    self.narrator.cut()
+                else:
+                    self.narrator.new([
+                        self.name, 'checks', self.his, 'bags,' if len(bags) > 1 else 'bag,',
+                        'finds', 'they are' if len(bags) > 1 else 'it is', 'empty'])
+                    self.narrator.cut()
             for i in range(1, len(bags)):
                 extra_bag = bags[i]
                 self._equipment.remove(extra_bag)
@@ -97,7 +98,7 @@ class Carrier(Body, CarryingEntity):
             self.remove_item('iodine')
             verbs = ['disinfects']
             tools = ['iodine']
-        elif Map().has_water(self):
+        elif self.map.has_water(self):
             self._max_health *= 0.99
             verbs = ['cleans']
             tools = [f'{self.current_area}\'s water']
@@ -116,13 +117,14 @@ class Carrier(Body, CarryingEntity):
             tools.append('bandages')
         else:
             self._max_health *= 0.95
-            tools.append(choice(['moss', 'cloth']))
+            tools.append(self.rng.choice(['moss', 'cloth']))
 
-        wound_name = 'wounds' if wound == BLEEDING else wound
-        Narrator().add(
-            [self.name, format_list(verbs), self.his, wound_name, verb_part_2, 'using', format_list(tools)],
-            stock=stock
-        )
+        if self.narrator.active:
+            wound_name = 'wounds' if wound == BLEEDING else wound
+            self.narrator.add(
+                [self.name, format_list(verbs), self.his, wound_name, verb_part_2, 'using', format_list(tools)],
+                stock=stock
+            )
 
         self.status.remove(wound)
 
@@ -146,44 +148,47 @@ class Carrier(Body, CarryingEntity):
     def loot(self, take_a_break=True):
         if take_a_break:
             self.take_a_break()
-        if Map().players_count(self) == 1:
-            item = Map().pick_best_item(self)
+        if self.map.players_count(self) == 1:
+            item = self.map.pick_best_item(self)
         else:
-            item = Map().pick_item(self.current_area)
+            item = self.map.pick_item(self.current_area)
         if item is None or (isinstance(item, Weapon) and item.damage_mult <= self.weapon.damage_mult):
-            Narrator().add([
+            self.narrator.add([
                 self.name, 'tries to loot', self.current_area.at, 'but can\'t find anything useful'])
             return
         if isinstance(item, Weapon):
             self.loot_weapon(item, retry=False)
         else:
-            Narrator().add([self.name, 'picks up', item.long_name, self.current_area.at])
+            self.narrator.add([self.name, 'picks up', item.long_name, self.current_area.at])
+            self.narrator.record(Verb.PICK_UP, self, area=self.current_area, weapon=item.name)
             self.get_item(item)
 
     def loot_weapon(self, weapon: Optional[Weapon]=None, retry=True):
         if weapon is None:
-            weapon = Map().pick_weapon(self.current_area)
+            weapon = self.map.pick_weapon(self.current_area)
         if weapon is None or (weapon.damage_mult <= self.weapon.damage_mult and (
-                    not weapon.small or Context().time == STARTER or self.bag is None)):
+                    not weapon.small or self.context.time == STARTER or self.bag is None)):
             if retry:
                 return self.loot(take_a_break=False)
             else:
-                Narrator().add([
+                self.narrator.add([
                     self.name, 'tries to find a weapon', self.current_area.at, 'but can\'t find anything good'])
             return
         if weapon.name == self.weapon.name:
             self.weapon.long_name.replace('\'s', '\'s old')
-            Narrator().add([
+            self.narrator.add([
                 self.name, 'picks up', f'a better {weapon.name}', self.current_area.at])
         else:
-            Narrator().add([self.name, 'picks up', weapon.long_name, self.current_area.at])
+            self.narrator.add([self.name, 'picks up', weapon.long_name, self.current_area.at])
+        self.narrator.record(Verb.PICK_UP, self, area=self.current_area, weapon=weapon.name)
         self.get_weapon(weapon)
 
     def loot_bag(self, take_a_break=True):
-        item = Map().pick_bag(self.current_area)
+        item = self.map.pick_bag(self.current_area)
         if item is None:
             return self.loot(take_a_break=take_a_break)
-        Narrator().add([self.name, 'picks up', item.long_name, self.current_area.at])
+        self.narrator.add([self.name, 'picks up', item.long_name, self.current_area.at])
+        self.narrator.record(Verb.PICK_UP, self, area=self.current_area, weapon=item.name)
         self.get_item(item)
 
     def estimate(self, item: Union[Item, List[Item]]) -> float:
@@ -225,9 +230,9 @@ class Carrier(Body, CarryingEntity):
     def drop_weapon(self, verbose=True, drop_verb='drops'):
         if self.weapon != HANDS:
             if verbose:
-                Narrator().add([
+                self.narrator.add([
                     self.name, drop_verb, f'{self.his} {self.weapon.name}', self.current_area.at])
-            Map().add_loot(self.weapon, self.current_area)
+            self.map.add_loot(self.weapon, self.current_area)
         self._weapon = HANDS
 
     def get_item(self, item):
@@ -261,22 +266,22 @@ class Carrier(Body, CarryingEntity):
     def craft_weapon(self):
         crafting_tool = self.has_crafting_tool
         with_tool = '' if crafting_tool is None else f'with {self.his} {crafting_tool.name}'
-        name = choice(['spear', 'club'])
-        weapon = Weapon(name, 1 + random() + (random() if crafting_tool is not None else 0))
+        name = self.rng.choice(['spear', 'club'])
+        weapon = Weapon(name, 1 + self.rng.random() + (self.rng.random() if crafting_tool is not None else 0))
         if weapon.damage_mult > self.weapon.damage_mult:
             description = weapon.long_name
             if weapon.name == self.weapon.name:
                 self.weapon.long_name = f'{self.name}\'s old {self.weapon.name}'
                 description = f'a better {weapon.name}'
-            Narrator().add([self.name, 'crafts', description, with_tool, self.current_area.at])
+            self.narrator.add([self.name, 'crafts', description, with_tool, self.current_area.at])
             self.get_weapon(weapon)
         else:
-            Narrator().add([
+            self.narrator.add([
                 self.name, 'tries to craft a better weapon', self.current_area.at])
 
     def fill_bottles(self):
         self.water_upkeep()
-        if Map().has_water(self):
+        if self.map.has_water(self):
             total_water = self.water + sum(b.fill for b in self.bottles)
             self._water = max(1.5, self.water)
             for b in self.bottles:
@@ -284,13 +289,13 @@ class Carrier(Body, CarryingEntity):
             new_total_water = self.water + sum(b.fill for b in self.bottles)
             if new_total_water > total_water + 1:
                 if len(self.bottles):
-                    Narrator().add([
+                    self.narrator.add([
                         self.name, 'fills', self.his, 'bottles' if len(self.bottles) > 1 else 'bottle',
                         self.current_area.at])
                 else:
-                    Narrator().add([self.name, 'drinks', self.current_area.at])
+                    self.narrator.add([self.name, 'drinks', self.current_area.at])
         else:
-            water = random()
+            water = self.rng.random()
             amount = min(self.thirst, water)
             self._water += amount
             water -= amount
@@ -315,18 +320,18 @@ class Carrier(Body, CarryingEntity):
         return amount
 
     def forage(self) -> Optional[Food]:
-        food: Food = Map().get_forage(self)
+        food: Food = self.map.get_forage(self)
         self.fill_bottles()
         if food is None:
-            Narrator().add([self.name, 'searches for food', 'but does not find anything edible'])
+            self.narrator.add([self.name, 'searches for food', 'but does not find anything edible'])
             return
         else:
             poison = False
             if food.value <= self.hunger:
-                Narrator().add([self.name, 'finds'])
+                self.narrator.add([self.name, 'finds'])
                 poison = self.eat(food, quantifier='some') == 'poison'
             else:
-                Narrator().add([self.name, 'finds', 'some', food.name, self.current_area.at])
+                self.narrator.add([self.name, 'finds', 'some', food.name, self.current_area.at])
                 food.value *= 2
             if not poison:
                 self.get_item(food)  # some extras / all of it
@@ -336,7 +341,7 @@ class Carrier(Body, CarryingEntity):
     def dine(self):
         self.take_a_break()
         if not self.has_food:
-            Narrator().add([self.name, 'does not have', 'anything to eat'])
+            self.narrator.add([self.name, 'does not have', 'anything to eat'])
         else:
             foods = [e for e in self.equipment if isinstance(e, Food)]
             foods.sort(key=lambda x: x.value)
@@ -349,28 +354,29 @@ class Carrier(Body, CarryingEntity):
                 if self.eat(meal, verbose=False) == 'poison':
                     poison = meal
                     break
-            Narrator().add([self.name, 'eats', self.his, format_list(diner), self.current_area.at])
+            if self.narrator.active:
+                self.narrator.add([self.name, 'eats', self.his, format_list(diner), self.current_area.at])
             if poison is not None:
-                Narrator().new([f'the {poison.name}', 'is', 'poisonous!'])
-                Narrator().cut()
+                self.narrator.new([f'the {poison.name}', 'is', 'poisonous!'])
+                self.narrator.cut()
                 self.consume_antidote()
 
     def eat(self, food: Food, quantifier='', verbose=True):
         if verbose:
-            Narrator().add([self.name, 'eats', quantifier, food.name, self.current_area.at])
+            self.narrator.add([self.name, 'eats', quantifier, food.name, self.current_area.at])
         self.consume_nutriments(food.value)
         if food.is_poisonous:
             self._poisons.append(copy(food.poison))
             while food in self.equipment:
                 self.remove_item(food)
             if verbose:
-                Narrator().new([f'The {food.name}', 'are' if food.name[-1] == 's' else 'is', 'poisonous!'])
-                Narrator().cut()
+                self.narrator.new([f'The {food.name}', 'are' if food.name[-1] == 's' else 'is', 'poisonous!'])
+                self.narrator.cut()
             return 'poison'
 
     def consume_antidote(self):
         if len(self.active_poisons) and self.has_item('antidote'):
-            Narrator().new([self.name, 'uses', self.his, 'antidote'])
+            self.narrator.new([self.name, 'uses', self.his, 'antidote'])
             poisons = copy(self.active_poisons)
             poisons.sort(key=lambda p: -p.damage * p.amount)
             self.remove_poison(poisons[0])
@@ -378,5 +384,5 @@ class Carrier(Body, CarryingEntity):
     def die(self):
         self.drop_weapon(verbose=False)
         for e in self._equipment:
-            Map().add_loot(e, self.current_area)
+            self.map.add_loot(e, self.current_area)
         Body.die(self)
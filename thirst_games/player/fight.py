@@ -1,17 +1,16 @@
 from typing import List, Dict
 
-from random import choice, random
-
 from thirst_games.abstract.playing_entity import PlayingEntity
 from thirst_games.constants import STARTER, SLEEPING, TRAPPED, FLEEING
-from thirst_games.context import Context
-from thirst_games.narrator import Narrator
 
 
 def do_a_fight(team_1: List[PlayingEntity], team_2: List[PlayingEntity]):
-    for player in set(team_1).intersection(set(team_2)):
-        Narrator().new(['ERROR', player.name, 'is in both groups'])
-        Narrator().cut()
+    narrator = team_1[0].narrator
+    context = team_1[0].context
+    rng = team_1[0].rng
+    for player in [p for p in team_1 if p in team_2]:
+        narrator.new(['ERROR', player.name, 'is in both groups'])
+        narrator.cut()
         if len(team_1) > 1:
             team_1.remove(player)
         if len(team_2) > 1:
@@ -20,13 +19,13 @@ def do_a_fight(team_1: List[PlayingEntity], team_2: List[PlayingEntity]):
     weapon_name: Dict[PlayingEntity, str] = {}
     drops = []
     at_area = team_1[0].current_area.at
-    # Narrator().new(['FIGHT between', [p.name for p in team_1], 'vs', [p.name for p in team_2], at_area])
+    # narrator.new(['FIGHT between', [p.name for p in team_1], 'vs', [p.name for p in team_2], at_area])
     for e in team_1:
-        initiative[e] = 1 + random()
+        initiative[e] = 1 + rng.random()
         if not len([e2 for e2 in team_2 if e2.can_see(e)]):
             initiative[e] += 1
     for e in team_2:
-        initiative[e] = 0 if SLEEPING in e.status else random()
+        initiative[e] = 0 if SLEEPING in e.status else rng.random()
 
     verbs_1 = ''
     if len([e for e in team_2 if FLEEING in e.status]) == len(team_2):
@@ -42,33 +41,33 @@ def do_a_fight(team_1: List[PlayingEntity], team_2: List[PlayingEntity]):
 
     def do_attack(attacker, defender, defending_team, surprise=''):
         if attacker in team_1:
-            Narrator().cut()
+            narrator.cut()
         attacker.busy = True
         attacker.reveal()
         defender.busy = True
         defender.reveal()
         if attacker.hit(defender, 1 + initiative[attacker] - initiative[defender]):
-            Narrator().add([
+            narrator.add([
                 attacker.name, verbs_1 + 'kills', defender.name, surprise, at_area, weapon_name[attacker]])
             drops.extend(player_2.drops)
             defending_team.remove(defender)
         else:
             verb = 'attacks' if fight_round == 1 and attacker in team_1 else 'fights'
-            Narrator().add([attacker.name, verbs_1 + verb, defender.name, at_area, weapon_name[attacker]])
-            Narrator().apply_stock()
-        if defender.is_alive and random() > defender.courage and defender.can_flee():
+            narrator.add([attacker.name, verbs_1 + verb, defender.name, at_area, weapon_name[attacker]])
+            narrator.apply_stock()
+        if defender.is_alive and rng.random() > defender.courage and defender.can_flee():
             w = defender.weapon
             defender.flee(panic=True)
             if defender.weapon != w:
                 drops.append(w)
             defending_team.remove(defender)
 
-    while len(team_1) and len(team_2) and (Context().time != STARTER or fight_round < 4):
+    while len(team_1) and len(team_2) and (context.time != STARTER or fight_round < 4):
         fight_round += 1
         for player_1 in team_1:
             if not len(team_2):
                 break
-            player_2 = choice(team_2)
+            player_2 = rng.choice(team_2)
 
             surprise_txt = f'in {player_2.his} sleep' if SLEEPING in player_2.status else (
                 f'while {player_2.he} is trapped' if TRAPPED in player_2.status else (
@@ -83,9 +82,9 @@ def do_a_fight(team_1: List[PlayingEntity], team_2: List[PlayingEntity]):
             initiative[player] = 1
             if not len(team_1):
                 break
-            do_attack(player, choice(team_1), team_1)
-        Narrator().cut()
-    # Narrator().new(['FIGHT is over', [p.name for p in team_1], 'vs', [p.name for p in team_2]])
+            do_attack(player, rng.choice(team_1), team_1)
+        narrator.cut()
+    # narrator.new(['FIGHT is over', [p.name for p in team_1], 'vs', [p.name for p in team_2]])
 
     if not len(team_2):
         for e in team_1:
@@ -1,18 +1,17 @@
 from typing import List, Optional, Union, Dict
 
 from copy import copy
-from random import random, choice
 
 from thirst_games.abstract.area import Area
 from thirst_games.abstract.entity import Entity
 from thirst_games.abstract.items import Weapon, Item, Bag, HANDS
-from thirst_games.abstract.playing_entity import PlayingEntity, Relationship, GroupedRelationship
-from thirst_games.context import Context
-from thirst_games.map import Map
-from thirst_games.narrator import format_list, Narrator
+from thirst_games.abstract.playing_entity import PlayingEntity, Strategy
+from thirst_games.event_log import Verb
+from thirst_games.narrator import format_list
 from thirst_games.player.fight import do_a_fight
 from thirst_games.player.player import Player
 from thirst_games.poison import Food
+from thirst_games.relationships import Relationship
 
 
 def player_names(players: List[Player]) -> str:
@@ -25,6 +24,7 @@ class Group(PlayingEntity):
         self.he = 'they'
         if not len(players):
             raise ValueError
+        self.bind(players[0].world)
         self._players = players
         self._acting_players = copy(players)
         self.move_to(players[0].current_area)
@@ -35,13 +35,16 @@ class Group(PlayingEntity):
         return [p for p in self._players if p.is_alive]
 
     def relationship(self, other_player) -> Relationship:
-        if len(other_player.players) > 1:
-            return GroupedRelationship([self.relationship(p) for p in other_player.players])
-        return GroupedRelationship([p.relationship(other_player) for p in self.players])
+        return self.world.relationships.grouped(
+            [p.index for p in self.players], [p.index for p in other_player.players])
 
     def current_group(self):
         return self.players
 
+    def candidate_strategies(self) -> List[Strategy]:
+        # what any of the members could do
+        return list(dict.fromkeys(s for p in self.players for s in p.candidate_strategies()))
+
     @property
     def name(self) -> str:
         return f'{self.acting_players[0].name}\'s group'
@@ -58,17 +61,13 @@ class Group(PlayingEntity):
         return f'G({format_list([p.name for p in self.players])})'
 
     def think(self):
-        strats = {}
-        for a in self.players:
-            for s, v in a.judge_strats().items():
-                strats[s] = strats.get(s, 0) + v
-        self.strategy = [s for s, v in strats.items() if v == max(strats.values())][0]
+        self.strategy = self.world.policy.decide(self)
         # print(f'{str(self)}:{self.strategy.name}')
         for a in self.players:
             a.strategy = self.strategy
 
     def act(self):
-        Narrator().cut()
+        self.narrator.cut()
         self.end_ambush()
         self._acting_players = []
         for p in self.players:
@@ -76,14 +75,12 @@ class Group(PlayingEntity):
             if player_strat == self.strategy:
                 self._acting_players.append(p)
             else:
-                if player_strat is not None:
-                    print(f'{p.name}:{player_strat.name}, group:{self.strategy.name}')
                 p.apply_strat(player_strat)
         if len(self.acting_players) > 1:
-            self.strategy.apply(self)
+            self.strategy.perform(self)
         elif len(self.acting_players) == 1:
-            self.strategy.apply(self.acting_players[0])
-        Narrator().cut()
+            self.strategy.perform(self.acting_players[0])
+        self.narrator.cut()
         self.acted = True
 
     def reset_turn(self):
@@ -121,7 +118,7 @@ class Group(PlayingEntity):
 
     def remove_item(self, item):
         players = copy(self.players)
-        players.sort(key=lambda x: random())
+        players.sort(key=lambda x: self.rng.random())
         removed = False
         for p in players:
             try:
@@ -138,29 +135,30 @@ class Group(PlayingEntity):
             player.flee(panic=panic, drop_verb=drop_verb, stock=stock, filtered_areas=filtered_areas)
 
     def pursue(self):
-        available_areas = [a for a in Map().areas if a not in Context().forbidden_areas]
+        available_areas = [a for a in self.map.areas if a not in self.context.forbidden_areas]
         available_areas.sort(key=lambda x: sum(p._pursue_value(x) for p in self.acting_players))
         out = None
         if not available_areas:
             out = self.go_to(available_areas[-1])
         if out is None:
             self.hide()
-            Narrator().replace('hides and rests', 'rests')
+            self.narrator.replace('hides and rests', 'rests')
         else:
-            targets = [p.name for p in Context().alive_players if p not in self.players]
-            players = 'players' if len(targets) > 2 else format_list(targets)
-            Narrator().add([self.name, 'searches for', players, out.at])
+            if self.narrator.active:
+                targets = [p.name for p in self.context.alive_players if p not in self.players]
+                players = 'players' if len(targets) > 2 else format_list(targets)
+                self.narrator.add([self.name, 'searches for', players, out.at])
             self.check_for_ambush_and_traps()
 
     def enemies(self, area: Area) -> List[PlayingEntity]:
-        return [p for p in Context().playing_entities_at(area) if p != self]  # TODO: consider
+        return [p for p in self.context.playing_entities_at(area) if p != self]  # TODO: consider
 
     def set_up_ambush(self):
-        self.stealth += (random() / 2 + 0.5) * (1 - self.stealth)
+        self.stealth += (self.rng.random() / 2 + 0.5) * (1 - self.stealth)
         self.end_ambush()
-        Map().add_ambusher(self, self)
+        self.map.add_ambusher(self, self)
         self._ambush = True
-        Narrator().add([self.name, 'sets up', 'an ambush', self.current_area.at])
+        self.narrator.add([self.name, 'sets up', 'an ambush', self.current_area.at])
 
     def can_see(self, other):
         for player in self.acting_players:
@@ -194,7 +192,7 @@ class Group(PlayingEntity):
             weapons = weapon
         if weapon is None:
             for _ in self.acting_players:
-                weapons.append(Map().pick_weapon(self))
+                weapons.append(self.map.pick_weapon(self))
         weapons = [w for w in weapons if w is not None]
 
         weapons.sort(key=lambda x: -x.damage_mult)
@@ -207,9 +205,10 @@ class Group(PlayingEntity):
                 if weapon.damage_mult > player.weapon.damage_mult:
                     if weapon.name == player.weapon.name:
                         player.weapon.long_name.replace('\'s', '\'s old')
-                        Narrator().add([player.name, 'picks up', f'a better {weapon.name}', self.current_area.at])
+                        self.narrator.add([player.name, 'picks up', f'a better {weapon.name}', self.current_area.at])
                     else:
-                        Narrator().add([player.name, 'picks up', weapon.long_name, self.current_area.at])
+                        self.narrator.add([player.name, 'picks up', weapon.long_name, self.current_area.at])
+                    self.narrator.record(Verb.PICK_UP, player, area=self.current_area, weapon=weapon.name)
                     if player.weapon != HANDS:
                         weapons.append(player.weapon)
                     player.get_weapon(weapon)
@@ -218,74 +217,77 @@ class Group(PlayingEntity):
                     break
             if not picked:
                 empty_handed.append(player)
-        if len(empty_handed):
+        if len(empty_handed) and self.narrator.active:
             verb = 'try' if len(empty_handed) > 1 else 'tries'
-            Narrator().add([
+            self.narrator.add([
                 player_names(empty_handed), verb, 'to find weapons', self.current_area.at,
                 'but can\'t find anything good'])
 
     def loot_bag(self):
         items: List[Item] = []
         for _ in self.acting_players:
-            b = Map().pick_bag(self)
+            b = self.map.pick_bag(self)
             if b is None:
-                b = Map().pick_item(self)
+                b = self.map.pick_item(self)
             if b is not None:
                 items.append(b)
 
-        items.sort(key=lambda x: (isinstance(x, Bag)) * 10 + random())
-        self.acting_players.sort(key=lambda x: (x.bag is not None) * 10 + random())
+        items.sort(key=lambda x: (isinstance(x, Bag)) * 10 + self.rng.random())
+        self.acting_players.sort(key=lambda x: (x.bag is not None) * 10 + self.rng.random())
 
         empty_handed: List[Player] = []
         for player in self.acting_players:
             if len(items):
                 item = items.pop(0)
-                Narrator().add([player.name, 'picks up', item.long_name, self.current_area.at])
+                self.narrator.add([player.name, 'picks up', item.long_name, self.current_area.at])
+                self.narrator.record(Verb.PICK_UP, player, area=self.current_area, weapon=item.name)
                 player.get_item(item)
             else:
                 empty_handed.append(player)
 
-        if len(empty_handed):
+        if len(empty_handed) and self.narrator.active:
             verb = 'try' if len(empty_handed) > 1 else 'tries'
-            Narrator().add([
+            self.narrator.add([
                 player_names(empty_handed), verb, 'to find loot', self.current_area.at,
                 'but can\'t find anything good'])
 
     def loot(self, take_a_break=True):
         items: List[Item] = []
         for _ in self.acting_players:
-            b = Map().pick_item(self)
+            b = self.map.pick_item(self)
             if b is not None:
                 items.append(b)
 
-        items.sort(key=lambda x: random())
-        self.acting_players.sort(key=lambda x: random())
+        items.sort(key=lambda x: self.rng.random())
+        self.acting_players.sort(key=lambda x: self.rng.random())
 
         empty_handed: List[Player] = []
         for player in self.acting_players:
             if len(items):
                 item = items.pop(0)
-                Narrator().add([player.name, 'picks up', item.long_name, self.current_area.at])
+                self.narrator.add([player.name, 'picks up', item.long_name, self.current_area.at])
+                self.narrator.record(Verb.PICK_UP, player, area=self.current_area, weapon=item.name)
                 player.get_item(item)
             else:
                 empty_handed.append(player)
 
-        if len(empty_handed):
+        if len(empty_handed) and self.narrator.active:
             verb = 'try' if len(empty_handed) > 1 else 'tries'
-            Narrator().add([
+            self.narrator.add([
                 player_names(empty_handed), verb, 'to find loot', self.current_area.at,
                 'but can\'t find anything good'])
 
     def hide(self, panic=False, stock=False):
         if panic:
-            Narrator().add([player_names(self.acting_players), 'hides', self.current_area.at], stock=stock)
+            if self.narrator.active:
+                self.narrator.add([player_names(self.acting_players), 'hides', self.current_area.at], stock=stock)
             return
         for player in self.acting_players:
             player.hide(stock=stock)
         # if self.sleep < 0.1 \
-        #         or (Context().time == NIGHT and Map().players_count == 1 and len(self.wounds) == 0) \
-        #         or (Map().players_count == 1 and self.sleep < 0.2 and len(self.wounds) == 0) \
-        #         or (Context().time == NIGHT and self.sleep < 0.3 and len(self.wounds) == 0):
+        #         or (self.context.time == NIGHT and self.map.players_count == 1 and len(self.wounds) == 0) \
+        #         or (self.map.players_count == 1 and self.sleep < 0.2 and len(self.wounds) == 0) \
+        #         or (self.context.time == NIGHT and self.sleep < 0.3 and len(self.wounds) == 0):
         #     self.go_to_sleep(stock=stock)
         #     return
         # return self.rest(stock=stock)
@@ -300,71 +302,74 @@ class Group(PlayingEntity):
             p.reveal()
 
     def go_to(self, area: Union[str, Area, Entity]) -> Optional[Area]:
-        area = Map().get_area(area)
+        area = self.map.get_area(area)
         if area != self.current_area:
             self.end_ambush()
             for p in self.acting_players:
                 p.go_to(area)
-            return Map().move_player(self, area)
+            return self.map.move_player(self, area)
         return None
 
     def go_get_drop(self, area: Area):
         out = self.go_to(area)
-        if out is not None:
-            Narrator().add([player_names(self.acting_players), f'goes {out.to} to get loot'])
+        if out is not None and self.narrator.active:
+            self.narrator.add([player_names(self.acting_players), f'goes {out.to} to get loot'])
         else:
-            Narrator().cut()
+            self.narrator.cut()
         if self.check_for_ambush_and_traps():
             return
-        seen_neighbors = [p for p in Map().potential_players(self) if self.can_see(p) and p not in self.players]
+        seen_neighbors = [p for p in self.map.potential_players(self) if self.can_see(p) and p not in self.players]
         free_neighbors = [p for p in seen_neighbors if p.current_area == self.current_area and not p.busy]
         potential_danger = sum([p.dangerosity for p in seen_neighbors])
         actual_danger = sum([p.dangerosity for p in free_neighbors])
 
         if potential_danger > self.dangerosity and potential_danger > self.courage:
-            Narrator().add([
-                player_names(self.acting_players), 'see', format_list([p.name for p in seen_neighbors])])
+            if self.narrator.active:
+                self.narrator.add([
+                    player_names(self.acting_players), 'see', format_list([p.name for p in seen_neighbors])])
             self.flee(filtered_areas=[area])
         elif actual_danger > self.dangerosity and actual_danger > self.courage:
-            Narrator().add([
-                player_names(self.acting_players), 'see', format_list([p.name for p in free_neighbors])])
+            if self.narrator.active:
+                self.narrator.add([
+                    player_names(self.acting_players), 'see', format_list([p.name for p in free_neighbors])])
             self.flee(filtered_areas=[area])
         elif actual_danger > 0:  # enemy present -> fight them
-            Narrator().cut()
+            self.narrator.cut()
             self.attack_at_random()
         elif potential_danger > 0 and actual_danger == 0:  # enemy busy but incoming
             if self.dangerosity > potential_danger:  # attack before the other(s) arrive
-                Narrator().cut()
+                self.narrator.cut()
                 self.attack_at_random()
             else:  # loot and go/get your load and hit the road
-                Narrator().add([
-                    player_names(self.acting_players), 'avoid', format_list([p.name for p in seen_neighbors])])
+                if self.narrator.active:
+                    self.narrator.add([
+                        player_names(self.acting_players), 'avoid', format_list([p.name for p in seen_neighbors])])
                 self.loot(take_a_break=False)
                 self.flee(filtered_areas=[area])
         else:  # servez-vous
             self.loot()
-        # if len(Narrator().current_sentence) == 0:
-        #     Narrator().add([
+        # if len(self.narrator.current_sentence) == 0:
+        #     self.narrator.add([
         #         str(self), f'potential_danger={potential_danger}', f'actual_danger={actual_danger}',
         #         f'dangerosity={self.dangerosity}', f'courage={self.courage}',
         #     ])
 
     def check_for_ambush_and_traps(self):
-        traps = Map().traps(self)
+        traps = self.map.traps(self)
         for t in traps:
-            if t.check(self):
-                t.apply(self)
+            if t.check(self.acting_players):
+                t.apply(self.acting_players)
                 return True
-        ambushers = Map().ambushers(self)
+        ambushers = self.map.ambushers(self)
         if not len(ambushers):
             return False
-        ambusher = choice(ambushers)
+        ambusher = self.rng.choice(ambushers)
         ambusher.trigger_ambush(self)
         return True
 
     def trigger_ambush(self, prey):
         self.end_ambush()
-        Narrator().new([prey.name, 'falls', 'into', f'{self.name}\'s ambush!'])
+        self.narrator.new([prey.name, 'falls', 'into', f'{self.name}\'s ambush!'])
         self.fight(prey)
 
     def take_a_break(self):
@@ -383,7 +388,7 @@ class Group(PlayingEntity):
                 if isinstance(e, Food):
                     food_owner[e] = player
         if not len(food_owner):
-            Narrator().add([self.name, 'does not have', 'anything to eat'])
+            self.narrator.add([self.name, 'does not have', 'anything to eat'])
         else:
             food = list(food_owner.keys())
             food.sort(key=lambda x: x.value)
@@ -408,10 +413,12 @@ class Group(PlayingEntity):
 
             for player in self.acting_players:
                 if len(diner[player]):
-                    Narrator().add([player.name, 'eats', player.his, format_list(diner[player]), self.current_area.at])
+                    if self.narrator.active:
+                        self.narrator.add(
+                            [player.name, 'eats', player.his, format_list(diner[player]), self.current_area.at])
                     if poison[player] is not None:
-                        Narrator().new([f'the {poison[player].name}', 'is', 'poisonous!'])
-                        Narrator().cut()
+                        self.narrator.new([f'the {poison[player].name}', 'is', 'poisonous!'])
+                        self.narrator.cut()
                     player.consume_antidote()
 
     def loot_start(self):
@@ -422,14 +429,9 @@ class Group(PlayingEntity):
         return sum([p.want_to_ally(player) for p in self.players]) / len(self.players)
 
     def new_ally(self, player):
-        self.relationship(player).set_allied(True)
-        for ally in Context().alive_players:
-            if ally.is_allied_to(player) and not self.is_allied_to(ally):
-                self.new_ally(ally)
-            if not ally.is_allied_to(player) and self.is_allied_to(ally):
-                ally.new_ally(player)
+        self.world.alliances.join(*self.players, *player.players)
 
     def end_ambush(self):
         if self._ambush:
             self._ambush = False
-            Map().remove_ambusher(self)
+            self.map.remove_ambusher(self)
@@ -0,0 +1,66 @@
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from thirst_games.abstract.playing_entity import PlayingEntity, Strategy
+
+
+class Decision(NamedTuple):
+    entity: PlayingEntity  # a player, or a group thinking together
+    candidates: List[Strategy]
+    observation: Any  # what the policy observed of the arena for the whole batch, see Policy.observe
+
+
+class Policy:
+    # chooses the strategies of the thinkers, given in batches of decisions.
+    # a batched policy decides for everyone when the phase starts, on the arena as it is then;
+    # the others are asked one entity at a time when it thinks, and see what the earlier thinkers did
+    batched = False
+
+    def __init__(self) -> None:
+        self.choices: Dict[PlayingEntity, Strategy] = {}
+
+    def observe(self, entities: List[PlayingEntity]) -> Any:
+        # None: the policy looks at the entities themselves
+        return None
+
+    def choose(self, decisions: List[Decision]) -> List[Optional[Strategy]]:
+        raise NotImplementedError
+
+    def decisions(self, entities: List[PlayingEntity]) -> List[Decision]:
+        observation = self.observe(entities)
+        return [Decision(e, e.candidate_strategies(), observation) for e in entities]
+
+    def prepare(self, entities: List[PlayingEntity]):
+        # called when a phase starts
+        self.choices.clear()
+        if self.batched:
+            entities = [e for e in entities if e.is_alive]
+            if entities:
+                self.choices.update(zip(entities, self.choose(self.decisions(entities))))
+
+    def decide(self, entity: PlayingEntity) -> Optional[Strategy]:
+        # called when the entity thinks: the choice made for the phase, else one made now
+        choice = self.choices.get(entity)
+        if choice is None:
+            choice = self.choose(self.decisions([entity]))[0]
+        return choice
+
+
+class HeuristicPolicy(Policy):
+    # the default: the preferences of the candidates, judged by each member on the live arena and summed for groups
+    def choose(self, decisions: List[Decision]) -> List[Optional[Strategy]]:
+        return [self._best(d) for d in decisions]
+
+    @staticmethod
+    def _best(decision: Decision) -> Optional[Strategy]:
+        strats = {}
+        area_terms = {}  # the area-wide terms are judged once for all the members
+        members = decision.entity.players
+        for p in members:
+            # a group's candidates are what any member could do: each member judges its own, like ScoringEngine
+            candidates = decision.candidates if len(members) == 1 else p.candidate_strategies()
+            for s, v in p.judge_strats(area_terms, candidates).items():
+                strats[s] = strats.get(s, 0) + v
+        if not strats:
+            return None
+        best = max(strats.values())
+        return next(s for s, v in strats.items() if v == best)
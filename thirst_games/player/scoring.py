@@ -0,0 +1,297 @@
+from typing import Callable, Dict, List, Optional
+
+from thirst_games.abstract.items import Bag, Bottle, Weapon
+from thirst_games.abstract.playing_entity import PlayingEntity, Strategy
+from thirst_games.constants import SLEEPING, TRAPPED
+from thirst_games.poison import Food
+from thirst_games.player.player import (
+    AllianceStrat, DropStrat, FleeStrat, ambush_strat, attack_strat, craft_strat_1, craft_strat_2, dine_strat,
+    duel_strat, fight_strat, forage_strat, free_trap_strat, hide_strat, hunt_player_strat, loot_bag_strat,
+    loot_start_strat, loot_strat, phase_strategies, trap_strat,
+)
+from thirst_games.player.policy import Decision, Policy
+from thirst_games.traps import can_build_any_trap
+
+try:
+    import numpy as np
+except ImportError:  # the vectorized engine is optional
+    np = None
+
+# players scored together: bounds the players x areas matrices of flee and drop strategies
+CHUNK_SIZE = 1024
+
+
+class Vitals:
+    # array-backed snapshot of everything the built-in preferences read, one row per player
+    def __init__(self, world, players: List[PlayingEntity]) -> None:
+        self.players = players
+        self.player_count = world.context.player_count
+        self.row = {p: i for i, p in enumerate(players)}
+        alliances = world.alliances
+        columns = {name: [] for name in [
+            'health', 'max_health', 'energy', 'sleep', 'stomach', 'thirst', 'damage', 'move_cost', 'dangerosity',
+            'wounds', 'stealth', 'wisdom', 'sleeping', 'trapped', 'no_bag', 'has_food', 'can_trap', 'poisoned',
+            'area', 'present_allies',
+        ]}
+        for p in players:
+            columns['health'].append(p.health)
+            columns['max_health'].append(p.max_health)
+            columns['energy'].append(p.energy)
+            columns['sleep'].append(p.sleep)
+            columns['stomach'].append(p.stomach)
+            columns['thirst'].append(p.thirst)
+            columns['damage'].append(p.weapon.damage_mult)
+            columns['move_cost'].append(p.move_cost)
+            columns['dangerosity'].append(p.dangerosity)
+            columns['wounds'].append(len(p.wounds))
+            columns['stealth'].append(p.stealth)
+            columns['wisdom'].append(p.wisdom)
+            columns['sleeping'].append(SLEEPING in p.status)
+            columns['trapped'].append(TRAPPED in p.status)
+            columns['no_bag'].append(p.bag is None)
+            columns['has_food'].append(p.has_food)
+            columns['can_trap'].append(can_build_any_trap(p))
+            columns['poisoned'].append(len(p.active_poisons) > 0)
+            columns['area'].append(p.current_area.index)
+            columns['present_allies'].append(0)
+        for name, values in columns.items():
+            setattr(self, name, np.array(values, dtype=float if name != 'area' else int))
+        self.hunger = 1 - self.stomach
+
+        areas = world.map.areas
+        self.players_count = np.array([len(a.players) for a in areas], dtype=float)
+        self.has_water = np.array([a.has_water for a in areas], dtype=float)
+        self.forage = np.array([world.map.forage_potential(a) for a in areas])
+        self.loot_count = np.array([len(a.loot) for a in areas], dtype=float)
+        loot = [LootSummary(a.loot) for a in areas]
+        for name in ['best_weapon', 'bags', 'full_bags', 'food', 'bottles', 'best_bottle', 'medical', 'antidote',
+                     'other']:
+            setattr(self, name, np.array([getattr(s, name) for s in loot], dtype=float))
+        # playing entities per area, and for each player the members of its alliance in each area
+        self.entities_count = np.zeros(len(areas))
+        self.allies_at: Dict[PlayingEntity, Dict[int, int]] = {}
+        for area in areas:
+            groups = alliances.groups(area.players)
+            self.entities_count[area.index] = len(groups)
+            for group in groups:
+                for p in group:
+                    if p in self.row:
+                        self.present_allies[self.row[p]] = len(group)
+                if alliances.size(group[0]) > 1:
+                    present = set(group)
+                    for p in alliances.alliance(group[0]):
+                        self.allies_at.setdefault(p, {})[area.index] = len(group) - (p in present)
+        self.no_enemies = (self.present_allies == self.players_count[self.area]).astype(float)
+        self.weaker_neighbors = np.zeros(len(players))
+        by_area: Dict[int, List[int]] = {}
+        for i, a in enumerate(self.area):
+            by_area.setdefault(int(a), []).append(i)
+        for rows in by_area.values():
+            thresholds = np.sort(self.dangerosity[rows] * 1.2)
+            self.weaker_neighbors[rows] = np.searchsorted(thresholds, self.dangerosity[rows], side='left')
+
+    def loot_estimate(self, rows, areas) -> 'np.ndarray':
+        # Carrier.estimate of the best item lying in each area, for each player: rows and areas broadcast together
+        none = -np.inf
+        estimate = np.maximum.reduce(np.broadcast_arrays(
+            np.where(self.best_weapon[areas] > none, self.best_weapon[areas] - self.damage[rows], none),
+            np.where(self.bags[areas] > 0, self.full_bags[areas], none),
+            np.where(self.food[areas] > 0, self.hunger[rows], none),
+            np.where(self.bottles[areas] > 0, self.thirst[rows] * self.best_bottle[areas], none),
+            np.where(self.medical[areas] > 0, np.where(self.wounds[rows] > 0, 1, 0.1), none),
+            np.where(self.antidote[areas] > 0, np.where(self.poisoned[rows] > 0, 1, 0.1), none),
+            np.where(self.other[areas] > 0, 0.2, none),
+        ))
+        return np.where(self.loot_count[areas] > 0, estimate, 0)
+
+
+class LootSummary:
+    # what Carrier.estimate needs to know about the items lying in an area
+    def __init__(self, loot) -> None:
+        self.best_weapon = max([i.damage_mult for i in loot if isinstance(i, Weapon)], default=-np.inf)
+        self.bags = any(isinstance(i, Bag) for i in loot)
+        self.full_bags = any(isinstance(i, Bag) and len(i.content) for i in loot)
+        self.food = any(isinstance(i, Food) for i in loot)
+        self.bottles = any(isinstance(i, Bottle) for i in loot)
+        self.best_bottle = max([i.fill for i in loot if isinstance(i, Bottle)], default=0)
+        self.medical = any(i.name in ['bandages', 'iodine'] for i in loot if not _typed(i))
+        self.antidote = any(i.name == 'antidote' for i in loot if not _typed(i))
+        self.other = any(i.name not in ['bandages', 'iodine', 'antidote'] for i in loot if not _typed(i))
+
+
+def _typed(item) -> bool:
+    return isinstance(item, (Weapon, Bag, Food, Bottle))
+
+
+def _hide(v, r):
+    need = np.maximum.reduce([
+        v.wounds[r] * 3, v.max_health[r] - v.health[r], 1 - v.energy[r], 1 - v.sleep[r],
+        v.thirst[r] * v.has_water[v.area[r]],
+    ])
+    return np.maximum(need * (v.max_health[r] - v.health[r] / 2) / v.players_count[v.area[r]], 0.1)
+
+
+def _fitness(v, r):
+    return v.health[r] * np.minimum.reduce([v.energy[r], v.stomach[r], v.sleep[r]]) * v.damage[r]
+
+
+# the built-in strategies as functions of the vitals and the scored rows, mirroring their `pref` lambdas
+_columns: Dict[Strategy, Callable] = {
+    hide_strat: _hide,
+    attack_strat: lambda v, r: _fitness(v, r) / v.player_count,
+    ambush_strat: lambda v, r: _fitness(v, r) * v.no_enemies[r],
+    hunt_player_strat: lambda v, r: v.health[r] * v.damage[r] * (v.player_count < 4),
+    fight_strat: lambda v, r: v.health[r] * (v.weaker_neighbors[r] + 0.1),
+    duel_strat: lambda v, r: (v.player_count == 2) * v.weaker_neighbors[r],
+    loot_strat: lambda v, r: (v.energy[r] - v.move_cost[r]) * np.where(v.damage[r] == 1, 2, 0.2) * v.loot_estimate(
+        r, v.area[r]),
+    loot_bag_strat: lambda v, r: v.damage[r] * v.bags[v.area[r]] * v.no_bag[r],
+    loot_start_strat: lambda v, r: np.maximum(
+        np.maximum(v.best_weapon[v.area[r]] - v.damage[r], 0), v.damage[r] * v.bags[v.area[r]] * v.no_bag[r]),
+    forage_strat: lambda v, r: v.hunger[r] * v.forage[v.area[r]] * v.no_enemies[r],
+    dine_strat: lambda v, r: v.hunger[r] * v.has_food[r] * v.no_enemies[r],
+    craft_strat_1: lambda v, r: (2 - v.damage[r]) * v.no_enemies[r],
+    craft_strat_2: lambda v, r: (v.energy[r] - 0.2) * (v.damage[r] < 2) * (2 - v.damage[r]) * v.no_enemies[r],
+    trap_strat: lambda v, r: (v.energy[r] - 0.2) * v.no_enemies[r] * v.can_trap[r],
+    free_trap_strat: lambda v, r: 1000 * v.trapped[r],
+}
+
+
+class ScoringEngine(Policy):
+    """
+    Scores the strategies of every thinker of a phase at once, over a players x strategies matrix.
+    On the same arena and without the random parts of the preferences, it takes the decisions of
+    HeuristicPolicy. Games still differ from the heuristic ones: decisions are taken on the state of the arena
+    when the phase starts, not when each entity thinks, and the random parts come from the engine's own stream.
+    """
+    batched = True
+
+    def __init__(self, world, seed: int) -> None:
+        if np is None:
+            raise ImportError('the vectorized scoring engine needs numpy')
+        Policy.__init__(self)
+        self.world = world
+        self.rng = np.random.default_rng(seed)
+
+    def observe(self, entities: List[PlayingEntity]) -> Vitals:
+        return Vitals(self.world, [p for e in entities for p in e.players])
+
+    def choose(self, decisions: List[Decision]) -> List[Optional[Strategy]]:
+        entities = [d.entity for d in decisions]
+        v = decisions[0].observation
+        # one column per strategy any thinker could pick: the phase catalog, then the odd ones (fleeing when sleepy...)
+        columns = list(dict.fromkeys([
+            *phase_strategies(self.world),
+            *(s for d in decisions for s in d.candidates if not isinstance(s, AllianceStrat)),
+        ]))
+        column = {s: j for j, s in enumerate(columns)}
+        flee_areas = np.array([s.area.index for s in columns if isinstance(s, FleeStrat)], dtype=int)
+        drop_areas = np.array([s.area.index for s in columns if isinstance(s, DropStrat)], dtype=int)
+
+        choices = []
+        start = 0
+        while start < len(entities):
+            first = start
+            size = len(entities[start].players)
+            start += 1
+            while start < len(entities) and size + len(entities[start].players) <= CHUNK_SIZE:
+                size += len(entities[start].players)
+                start += 1
+            chunk = decisions[first:start]
+            rows = np.array([v.row[p] for d in chunk for p in d.entity.players], dtype=int)
+            # each member only scores its own candidates, as in Player.judge_strats
+            allowed = np.zeros((len(rows), len(columns)), dtype=bool)
+            k = 0
+            for d in chunk:
+                members = d.entity.players
+                for p in members:
+                    candidates = d.candidates if len(members) == 1 else p.candidate_strategies()
+                    allowed[k, [column[s] for s in candidates if s in column]] = True
+                    k += 1
+            flee = self._flee(v, rows, flee_areas) if len(flee_areas) else None
+            drop = self._drop(v, rows, drop_areas) if len(drop_areas) else None
+            scores = np.empty((len(rows), len(columns)))
+            i_flee = i_drop = 0
+            for j, s in enumerate(columns):
+                if isinstance(s, FleeStrat):
+                    scores[:, j] = flee[:, i_flee]
+                    i_flee += 1
+                elif isinstance(s, DropStrat):
+                    scores[:, j] = drop[:, i_drop]
+                    i_drop += 1
+                elif s in _columns:
+                    scores[:, j] = _columns[s](v, rows)
+                else:  # not a built-in: ask it, one player at a time
+                    scores[:, j] = [s.pref(v.players[i]) for i in rows]
+            scores += self.rng.random(scores.shape) * (1 - v.wisdom[rows])[:, None]
+            # members of a group add up their scores, as in HeuristicPolicy
+            starts = np.cumsum([0, *[len(d.entity.players) for d in chunk[:-1]]])
+            totals = np.add.reduceat(np.where(allowed, scores, 0), starts, axis=0)
+            totals[np.add.reduceat(allowed, starts, axis=0) == 0] = -np.inf
+            best = totals.argmax(axis=1)
+            for k, d in enumerate(chunk):
+                strategy, value = columns[best[k]], totals[k, best[k]]
+                if value == -np.inf:
+                    strategy = None
+                alliance = self._best_alliance(d.entity, d.candidates)
+                if alliance is not None and (strategy is None or alliance[1] > value):
+                    strategy = alliance[0]
+                choices.append(strategy)
+        return choices
+
+    @staticmethod
+    def _flee(v, rows, areas):
+        # Player._flee_value over the given areas, divided by 30
+        here = v.area[rows][:, None] == areas[None, :]
+        allies = np.zeros((len(rows), len(areas)))
+        column = {a: j for j, a in enumerate(areas)}
+        for k, i in enumerate(rows):
+            for a, count in v.allies_at.get(v.players[i], {}).items():
+                if a in column:
+                    allies[k, column[a]] = count
+        value = -(v.entities_count[areas][None, :] - here) * 10 + v.loot_count[areas][None, :] \
+            + v.thirst[rows][:, None] * v.has_water[areas][None, :] + np.where(here, 0, 30 * allies) + 1
+        return value / 30
+
+    def _drop(self, v, rows, areas):
+        # Player.should_go_get_drop over the given areas; players heading to an area are judged as seen from afar
+        danger = np.zeros((len(rows), len(areas)))
+        wisdom = v.wisdom[rows]
+        for j, a in enumerate(areas):
+            neighbors = [p for p in self.world.map.potential_players(int(a)) if p in v.row]
+            if not neighbors:
+                continue
+            seen = np.array([v.row[p] for p in neighbors], dtype=int)
+            order = np.argsort(v.stealth[seen] * 2)
+            thresholds = (v.stealth[seen] * 2)[order]
+            cumulated = np.concatenate([[0], np.cumsum(v.dangerosity[seen][order])])
+            danger[:, j] = cumulated[np.searchsorted(thresholds, wisdom, side='left')]
+            # players in this area look at each other up close, with a random factor
+            local = np.nonzero(v.area[rows] == a)[0]
+            if len(local):
+                present = np.array([v.row[p] for p in neighbors if p.current_area.index == a], dtype=int)
+                afar = (wisdom[local][:, None] > v.stealth[present][None, :] * 2) * v.dangerosity[present][None, :]
+                factor = self.rng.random((len(local), len(present))) * 0.5 + 0.5
+                close = (factor * wisdom[local][:, None] > v.stealth[present][None, :]) \
+                    * v.dangerosity[present][None, :]
+                close[rows[local][:, None] == present[None, :]] = 0
+                danger[local, j] += close.sum(axis=1) - afar.sum(axis=1)
+            # nobody sees themselves
+            mine = np.isin(rows, seen) & (v.area[rows] != a)
+            danger[mine, j] -= (wisdom[mine] > v.stealth[rows[mine]] * 2) * v.dangerosity[rows[mine]]
+        danger[v.sleeping[rows] > 0] = 0
+        value = v.dangerosity[rows][:, None] + v.loot_estimate(rows[:, None], areas[None, :]) - danger
+        return value * np.minimum(self.rng.random(value.shape), 3 / v.player_count)
+
+    def _best_alliance(self, entity, candidates: List[Strategy]):
+        # alliance offers are local to the area and mostly worthless: scored sparsely, in Python
+        best = None
+        members = entity.players
+        for strategy in [s for s in candidates if isinstance(s, AllianceStrat)]:
+            target = strategy.player
+            if target in members or any(p.is_allied_to(target) for p in members):
+                continue
+            value = sum(p.want_to_ally(target) + self.rng.random() * (1 - p.wisdom) for p in members)
+            if best is None or value > best[1]:
+                best = (strategy, value)
+        return best
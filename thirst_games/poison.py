@@ -1,8 +1,7 @@
-from random import random, randint
+from random import Random
 
 from thirst_games.abstract.entity import LivingEntity
 from thirst_games.abstract.items import AbstractPoison, Item
-from thirst_games.narrator import Narrator
 
 
 class Poison(AbstractPoison):
@@ -20,19 +19,19 @@ class Poison(AbstractPoison):
         live = player.is_alive
         player.add_health(-self.damage)
         if live and not player.is_alive:
-            Narrator().new([player.name, 'succumbs', 'to', self.long_name])
+            player.narrator.new([player.name, 'succumbs', 'to', self.long_name])
 
     def __str__(self):
         return f'{self.name}({int(self.damage * 100)}x{self.amount})'
 
 
 class Food(Item):
-    def __init__(self, name, value):
+    def __init__(self, name, value, rng: Random):
         Item.__init__(self, name)
         self.value = value
         self.poison = None
-        if self.name in ['berries', 'fruits', 'mushrooms'] and random() > 0.8:
-            self.poison = Poison(f'{self.name}\' poison', randint(3, 9), random() / 10 + 0.05)
+        if self.name in ['berries', 'fruits', 'mushrooms'] and rng.random() > 0.8:
+            self.poison = Poison(f'{self.name}\' poison', rng.randint(3, 9), rng.random() / 10 + 0.05)
 
     @property
     def is_poisonous(self):
@@ -0,0 +1,53 @@
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class PhaseProfile:
+    # everything recorded during one phase of the game
+    def __init__(self) -> None:
+        self.calls: Dict[Tuple[str, str], int] = {}  # (hook, name) -> number of calls
+        self.seconds: Dict[Tuple[str, str], float] = {}  # (hook, name) -> cumulative time
+        self.chosen: Dict[str, int] = {}  # strategy kind -> number of thinkers who chose it
+
+    def add(self, hook: str, name: str, seconds: float):
+        key = (hook, name)
+        self.calls[key] = self.calls.get(key, 0) + 1
+        self.seconds[key] = self.seconds.get(key, 0) + seconds
+
+
+class Profiler:
+    # opt-in instrumentation of the decisions (think, Strategy.pref) and actions (act, Strategy.apply):
+    # without a profiler on the world, the instrumented code only checks for None
+    hooks = ['think', 'act', 'pref', 'apply']
+
+    def __init__(self) -> None:
+        self.phases: Dict[Tuple[int, str], PhaseProfile] = {}  # (day, phase) -> profile, in the order played
+        self._phase: Optional[PhaseProfile] = None
+
+    def start_phase(self, day: int, phase: str):
+        self._phase = self.phases.setdefault((day, phase), PhaseProfile())
+
+    def timed(self, hook: str, name: str, function: Callable, *args):
+        start = perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self._phase.add(hook, name, perf_counter() - start)
+
+    def chose(self, strategy):
+        if strategy is not None:
+            self._phase.chosen[strategy.kind] = self._phase.chosen.get(strategy.kind, 0) + 1
+
+    def report(self, top: int=10) -> str:
+        lines: List[str] = []
+        for (day, phase), profile in self.phases.items():
+            lines.append(f'== PROFILE: day {day} {phase} ==')
+            for hook in self.hooks:
+                keys = [key for key in profile.calls if key[0] == hook]
+                keys.sort(key=lambda k: -profile.seconds[k])
+                for key in keys[:top]:
+                    lines.append(f'{hook:<6} {key[1]:<32} {profile.calls[key]:>8} calls {profile.seconds[key]:>10.4f}s')
+            chosen = sorted(profile.chosen.items(), key=lambda x: -x[1])
+            for name, count in chosen[:top]:
+                lines.append(f'chose  {name:<32} {count:>8} times')
+        return '\n'.join(lines)
@@ -0,0 +1,142 @@
+from array import array
+from typing import Callable, Dict, List
+
+MASK_64 = (1 << 64) - 1
+
+
+class Relationship:
+    # what one player thinks of another: a view on a cell of the store
+    def __init__(self, store: 'Relationships', cell: int):
+        self._store = store
+        self._cell = cell
+
+    @property
+    def friendship(self) -> float:
+        return self._store.friendship[self._cell]
+
+    def add_friendship(self, value: float):
+        self._store.add(self._store.friendship, [self._cell], value)
+
+    @property
+    def trust(self) -> float:
+        return self._store.trust[self._cell]
+
+    def add_trust(self, value: float):
+        self._store.add(self._store.trust, [self._cell], value)
+
+
+class GroupedRelationship(Relationship):
+    # the average of several cells of the store, updates apply to each cell
+    def __init__(self, store: 'Relationships', cells: List[int]):
+        Relationship.__init__(self, store, 0)
+        self._cells = cells
+
+    @property
+    def friendship(self) -> float:
+        return self._store.average(self._store.friendship, self._cells)
+
+    def add_friendship(self, value: float):
+        self._store.add(self._store.friendship, self._cells, value)
+
+    @property
+    def trust(self) -> float:
+        return self._store.average(self._store.trust, self._cells)
+
+    def add_trust(self, value: float):
+        self._store.add(self._store.trust, self._cells, value)
+
+
+class Relationships:
+    # friendship and trust of every ordered pair of players, in two flat size*size float arrays
+    # indexed by player index: row is the player who feels, column the player it is about
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.friendship = array('d', [0]) * (size * size)
+        self.trust = array('d', [0]) * (size * size)
+        self.friendship[::size + 1] = array('d', [1]) * size
+        self.trust[::size + 1] = array('d', [1]) * size
+        self.row_versions = array('L', [0]) * size  # bumped when the feelings of a player change
+
+    def cell(self, index_a: int, index_b: int) -> int:
+        return index_a * self.size + index_b
+
+    def pair(self, index_a: int, index_b: int) -> Relationship:
+        return Relationship(self, self.cell(index_a, index_b))
+
+    def grouped(self, rows: List[int], columns: List[int]) -> GroupedRelationship:
+        return GroupedRelationship(self, [r * self.size + c for r in rows for c in columns])
+
+    @staticmethod
+    def average(values: array, cells: List[int]) -> float:
+        return sum(map(values.__getitem__, cells)) / len(cells)
+
+    def add(self, values: array, cells: List[int], value: float):
+        for cell in cells:
+            values[cell] = max(-1, min(1, values[cell] + value))
+            self.row_versions[cell // self.size] += 1
+
+    def seed(self, players: List, rng):
+        # initial feelings, drawn in the same order as one add_friendship/add_trust per pair;
+        # every pair starts at 0 and draws stay within [0, 1], so they are written as they are
+        random = rng.random
+        friendship = self.friendship
+        trust = self.trust
+        for group in self.seeded_groups(players):
+            for p in group:
+                row = p.index * self.size
+                for p2 in group:
+                    if p is p2:
+                        continue
+                    cell = row + p2.index
+                    if p.district == p2.district:
+                        friendship[cell] = random() * 0.5 + 0.5
+                        trust[cell] = random() * 0.5
+                    else:
+                        friendship[cell] = random()
+                        trust[cell] = random() * 0.25
+
+    def seeded_groups(self, players: List) -> List[List]:
+        return [players]
+
+
+class SparseTable(dict):
+    # cells never written read as a default computed from the cell
+    def __init__(self, default: Callable[[int], float]) -> None:
+        dict.__init__(self)
+        self._default = default
+
+    def __missing__(self, cell: int) -> float:
+        return self._default(cell)
+
+
+class SparseRelationships(Relationships):
+    # only pairs of the same district and pairs that interacted are stored: the others read as values
+    # mixed from the seed and the cell, uniform like the draws of the dense store
+    def __init__(self, size: int, seed: int) -> None:
+        self.size = size
+        self._key = seed & MASK_64
+        self.friendship = SparseTable(self._default_friendship)
+        self.trust = SparseTable(self._default_trust)
+        for i in range(size):
+            self.friendship[i * (size + 1)] = 1
+            self.trust[i * (size + 1)] = 1
+        self.row_versions = array('L', [0]) * size
+
+    def _mix(self, value: int) -> float:
+        # splitmix64 finalizer, scaled to [0, 1)
+        z = (self._key + value * 0x9E3779B97F4A7C15) & MASK_64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK_64
+        return ((z ^ (z >> 31)) >> 11) / (1 << 53)
+
+    def _default_friendship(self, cell: int) -> float:
+        return self._mix(2 * cell)
+
+    def _default_trust(self, cell: int) -> float:
+        return self._mix(2 * cell + 1) * 0.25
+
+    def seeded_groups(self, players: List) -> List[List]:
+        districts: Dict[int, List] = {}
+        for p in players:
+            districts.setdefault(p.district, []).append(p)
+        return list(districts.values())
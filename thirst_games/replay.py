@@ -0,0 +1,277 @@
+"""
+Compact binary archives of played games, replayed into their story:
+
+    python -m thirst_games.replay games.tgr              # the story of every game of the archive
+    python -m thirst_games.replay games.tgr --game 3     # only the fourth game
+    python -m thirst_games.replay games.tgr --events     # the recorded events, without replaying
+
+An archive is the magic bytes followed by one frame per game: the size of the game then the game.
+A game holds its seed, the options it was played with, a string table (names, pronouns, areas, weapons),
+the roster and the event log, all numbers as varints. Replaying plays the game again from the seed
+and checks that it logs the same events.
+"""
+import argparse
+import mmap
+import struct
+import sys
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+
+from thirst_games.arena import ArenaGenerator
+from thirst_games.event_log import NOBODY, PHASES, Record, Verb
+from thirst_games.game import Game
+from thirst_games.narrator import EVERY_DAY
+from thirst_games.player.player import Player
+from thirst_games.world import World
+
+MAGIC = b'TGR\x01'
+
+_VECTORIZED = 1
+_SPARSE_RELATIONSHIPS = 2
+_GENERATED_ARENA = 4
+
+_double = struct.Struct('<d')
+
+
+class ArchivedGame(NamedTuple):
+    seed: int
+    vectorized: bool
+    sparse_relationships: bool
+    arena: Optional[ArenaGenerator]
+    roster: List[Tuple[str, int, str]]  # name, district, pronoun, in the order of the game
+    areas: List[str]  # full names, in the order of the map
+    records: List[Record]
+
+
+def _write_varint(out: bytearray, n: int):
+    while n > 0x7f:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data, pos: int) -> Tuple[int, int]:
+    n = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        n |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return n, pos
+        shift += 7
+
+
+def _zigzag(n: int) -> int:
+    # small negative numbers stay short: 0, -1, 1, -2... become 0, 1, 2, 3...
+    return n * 2 if n >= 0 else -n * 2 - 1
+
+
+def _unzigzag(n: int) -> int:
+    return n >> 1 if not n & 1 else -(n >> 1) - 1
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {'': 0}
+        self.strings: List[str] = ['']
+
+    def id(self, string: str) -> int:
+        if string not in self.ids:
+            self.ids[string] = len(self.strings)
+            self.strings.append(string)
+        return self.ids[string]
+
+
+def encode_game(game: Game) -> bytes:
+    if game.world.log is None:
+        raise ValueError('only games of worlds created with record=True can be archived')
+    strings = _StringTable()
+    body = bytearray()
+    arena: Optional[ArenaGenerator] = game.arena
+    if arena is not None:
+        for value in (arena.players_per_area, arena.loot_density, arena.weapon_ratio):
+            body += _double.pack(value)
+        _write_varint(body, len(arena.biomes))
+        for name, weight in arena.biomes.items():
+            _write_varint(body, strings.id(name))
+            body += _double.pack(weight)
+    _write_varint(body, len(game.players))
+    for p in game.players:
+        _write_varint(body, strings.id(p.name))
+        _write_varint(body, _zigzag(p.district))
+        _write_varint(body, strings.id(p.he))
+    _write_varint(body, len(game.map.areas))
+    for area in game.map.areas:
+        _write_varint(body, strings.id(area.full_name))
+    records = game.world.log.records
+    _write_varint(body, len(records))
+    for r in records:
+        for n in (r.day, r.phase, r.verb, r.actor + 1, r.target + 1, r.area + 1):  # NOBODY is -1
+            _write_varint(body, n)
+        _write_varint(body, strings.id(r.weapon))
+
+    flags = (_VECTORIZED if game.world.vectorized else 0) \
+        | (_SPARSE_RELATIONSHIPS if game.sparse_relationships else 0) \
+        | (_GENERATED_ARENA if arena is not None else 0)
+    head = bytearray()
+    _write_varint(head, _zigzag(game.world.seed))
+    head.append(flags)
+    _write_varint(head, len(strings.strings) - 1)
+    for string in strings.strings[1:]:
+        encoded = string.encode()
+        _write_varint(head, len(encoded))
+        head += encoded
+    return bytes(head + body)
+
+
+def decode_game(data, pos: int=0) -> ArchivedGame:
+    # data is any buffer (bytes, mmap...) holding the game at pos
+    seed, pos = _read_varint(data, pos)
+    flags = data[pos]
+    pos += 1
+    count, pos = _read_varint(data, pos)
+    strings = ['']
+    for _ in range(count):
+        length, pos = _read_varint(data, pos)
+        strings.append(bytes(data[pos:pos + length]).decode())
+        pos += length
+
+    arena = None
+    if flags & _GENERATED_ARENA:
+        players_per_area, loot_density, weapon_ratio = struct.unpack_from('<3d', data, pos)
+        pos += 3 * _double.size
+        biomes = {}
+        count, pos = _read_varint(data, pos)
+        for _ in range(count):
+            name, pos = _read_varint(data, pos)
+            biomes[strings[name]] = _double.unpack_from(data, pos)[0]
+            pos += _double.size
+        arena = ArenaGenerator(players_per_area, biomes, loot_density, weapon_ratio)
+
+    roster = []
+    count, pos = _read_varint(data, pos)
+    for _ in range(count):
+        name, pos = _read_varint(data, pos)
+        district, pos = _read_varint(data, pos)
+        he, pos = _read_varint(data, pos)
+        roster.append((strings[name], _unzigzag(district), strings[he]))
+    areas = []
+    count, pos = _read_varint(data, pos)
+    for _ in range(count):
+        name, pos = _read_varint(data, pos)
+        areas.append(strings[name])
+    records = []
+    count, pos = _read_varint(data, pos)
+    for _ in range(count):
+        values = []
+        for _ in range(7):
+            n, pos = _read_varint(data, pos)
+            values.append(n)
+        day, phase, verb, actor, target, area, weapon = values
+        records.append(Record(day, phase, Verb(verb), actor - 1, target - 1, area - 1, strings[weapon]))
+    return ArchivedGame(
+        _unzigzag(seed), bool(flags & _VECTORIZED), bool(flags & _SPARSE_RELATIONSHIPS), arena, roster, areas, records,
+    )
+
+
+class Recorder:
+    # appends games to an archive, writing the magic bytes when the file is new
+    def __init__(self, file: BinaryIO) -> None:
+        self.file = file
+        if file.tell() == 0:
+            file.write(MAGIC)
+
+    def write(self, game: Game):
+        self.write_encoded(encode_game(game))
+
+    def write_encoded(self, data: bytes):
+        # for games encoded elsewhere, like in the workers of a batch
+        frame = bytearray()
+        _write_varint(frame, len(data))
+        self.file.write(frame)
+        self.file.write(data)
+
+
+class Archive:
+    # reads an archive through a memory map: frames are skipped without being decoded
+    def __init__(self, path: str) -> None:
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as e:  # empty file
+            self._file.close()
+            raise ValueError(f'{path} is not a game archive') from e
+        if self._data[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f'{path} is not a game archive')
+
+    def offsets(self) -> Iterator[int]:
+        # where each game starts in the archive
+        data = self._data
+        pos = len(MAGIC)
+        while pos < len(data):
+            length, pos = _read_varint(data, pos)
+            yield pos
+            pos += length
+
+    def game(self, offset: int) -> ArchivedGame:
+        return decode_game(self._data, offset)
+
+    def __iter__(self) -> Iterator[ArchivedGame]:
+        for offset in self.offsets():
+            yield self.game(offset)
+
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self) -> 'Archive':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def replay(archived: ArchivedGame, sink: Optional[TextIO]=None) -> Game:
+    # plays the game again with its narrator on, telling the story to sink (sys.stdout by default)
+    world = World(archived.seed, vectorized=archived.vectorized, output=sink, flush_every=EVERY_DAY, record=True)
+    game = Game(
+        [Player(name, district, he) for name, district, he in archived.roster], world,
+        arena=archived.arena, sparse_relationships=archived.sparse_relationships,
+    )
+    game.run()
+    if world.log.records != archived.records:
+        raise ValueError(f'game {archived.seed} does not replay as recorded, was it played by another version?')
+    return game
+
+
+def render_events(archived: ArchivedGame) -> Iterator[str]:
+    names = [name for name, _, _ in archived.roster]
+    for r in archived.records:
+        where = f' at the {archived.areas[r.area]}' if r.area != NOBODY else ''
+        who = names[r.actor] if r.actor != NOBODY else '-'
+        whom = f' {names[r.target]}' if r.target != NOBODY else ''
+        what = f' ({r.weapon})' if r.weapon else ''
+        yield f'day {r.day} {PHASES[r.phase]:<9} {r.verb.name:<12} {who}{whom}{where}{what}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replays archived games')
+    parser.add_argument('archive')
+    parser.add_argument('--game', type=int, help='only the game at this position in the archive')
+    parser.add_argument('--events', action='store_true', help='list the recorded events instead of replaying')
+    args = parser.parse_args()
+    with Archive(args.archive) as archive:
+        for i, offset in enumerate(archive.offsets()):
+            if args.game is not None and i != args.game:
+                continue
+            archived = archive.game(offset)
+            print(f'##### GAME {i} (seed {archived.seed}) #####')
+            if args.events:
+                for line in render_events(archived):
+                    print(line)
+            else:
+                replay(archived, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,8 @@
 from typing import Type, List, Union
 
-from random import random, choice
-
 from thirst_games.abstract.entity import Entity, AbstractTrap
 from thirst_games.abstract.playing_entity import PlayingEntity
-from thirst_games.constants import TRAPPED
-from thirst_games.map import START_AREA, Map
-from thirst_games.narrator import Narrator
+from thirst_games.constants import TRAPPED, START_AREA
 
 
 class Trap(AbstractTrap):
@@ -22,20 +18,21 @@ class Trap(AbstractTrap):
         self.owner = owner
         self.knowing = owner.players
         self.stealth = stealth
-        Map().add_trap(self, owner)
+        self.bind(owner.world)
+        self.map.add_trap(self, owner)
 
     def check(self, players: Union[PlayingEntity, List[PlayingEntity]], panic=False) -> bool:
         if not isinstance(players, list):
             players = [players]
         if panic:
-            return random() > 0.5
+            return self.rng.random() > 0.5
         noticed = False
         for player in players:
             if player in self.knowing:
                 noticed = True
                 break
             if player.can_see(self):
-                Narrator().add([player.name, 'notices', self.long_name])
+                self.narrator.add([player.name, 'notices', self.long_name])
                 noticed = True
                 break
         if noticed:
@@ -43,7 +40,7 @@ class Trap(AbstractTrap):
                 if player not in self.knowing:
                     self.knowing.append(player)
             return False
-        return random() > 0.5
+        return self.rng.random() > 0.5
 
     def _apply(self, name, player):
         raise NotImplementedError
@@ -52,12 +49,12 @@ class Trap(AbstractTrap):
         if not isinstance(players, list):
             players = [players]
         if not self.group_trap:
-            players = [choice(players)]
+            players = [self.rng.choice(players)]
+        self.map.remove_trap(self)
         for player in players:
             name = self.long_name
             if player is self.owner:
                 name = f'{player.his} own {self.name}'
-            Map().remove_trap(self)
             player.reveal()
             self._apply(name, player)
 
@@ -80,13 +77,13 @@ class StakeTrap(Trap):
     _name = 'stake trap'
 
     def _apply(self, name, player):
-        if player.be_damaged(random(), 'trident'):
-            Narrator().new([player.name, 'impales', f'{player.him}self', 'on', f'{name}!'])
+        if player.be_damaged(self.rng.random(), 'trident'):
+            self.narrator.new([player.name, 'impales', f'{player.him}self', 'on', f'{name}!'])
         else:
-            Narrator().new([player.name, 'falls', f'into', f'{name}!'])
-            if not Narrator().has_stock:
-                Narrator().add([player.name, 'is', 'lightly wounded'])
-            Narrator().apply_stock()
+            self.narrator.new([player.name, 'falls', f'into', f'{name}!'])
+            if not self.narrator.has_stock:
+                self.narrator.add([player.name, 'is', 'lightly wounded'])
+            self.narrator.apply_stock()
 
 
 class ExplosiveTrap(Trap):
@@ -97,13 +94,13 @@ class ExplosiveTrap(Trap):
     group_trap = True
 
     def _apply(self, name, player):
-        if player.be_damaged(random() * 5, 'fire'):
-            Narrator().new([player.name, 'blows up', 'on', f'{name}!'])
+        if player.be_damaged(self.rng.random() * 5, 'fire'):
+            self.narrator.new([player.name, 'blows up', 'on', f'{name}!'])
         else:
-            Narrator().new([player.name, 'steps', 'on', f'{name}!'])
-            if not Narrator().has_stock:
-                Narrator().add([player.name, 'is', 'wounded'])
-            Narrator().apply_stock()
+            self.narrator.new([player.name, 'steps', 'on', f'{name}!'])
+            if not self.narrator.has_stock:
+                self.narrator.add([player.name, 'is', 'wounded'])
+            self.narrator.apply_stock()
 
 
 class NetTrap(Trap):
@@ -113,7 +110,7 @@ class NetTrap(Trap):
     _name = 'net trap'
 
     def _apply(self, name, player):
-        Narrator().new([player.name, 'gets', 'ensnared into', f'{name}!'])
+        self.narrator.new([player.name, 'gets', 'ensnared into', f'{name}!'])
         player.status.append(TRAPPED)
         take_advantage_of_trap(self, player)
 
@@ -125,10 +122,10 @@ class WireTrap(Trap):
     _name = 'wire trap'
 
     def _apply(self, name, player):
-        Narrator().new([player.first_name, 'gets', 'ensnared into', f'{name}!'])
-        if random() > 0.5:
+        self.narrator.new([player.first_name, 'gets', 'ensnared into', f'{name}!'])
+        if self.rng.random() > 0.5:
             player.status.append('leg wound')
-            Narrator().add([player.name, 'wounds', player.his, 'leg'])
+            self.narrator.add([player.name, 'wounds', player.his, 'leg'])
         else:
             player.status.append(TRAPPED)
             take_advantage_of_trap(self, player)
@@ -138,7 +135,7 @@ def take_advantage_of_trap(trap, player):
     if trap.owner.current_area == player.current_area and not trap.owner.busy:
         # can attack
         if trap.owner.dangerosity() > player.dangerosity():
-            Narrator().cut()
+            trap.narrator.cut()
             trap.owner.fight(player)
 
 
@@ -149,8 +146,8 @@ def build_trap(player, trap_class: Type[Trap]):
     for ingredient in trap_class.ingredients:
         item = [i for i in player.equipment if i.name == ingredient][0]
         player.remove_item(item)
-    trap = trap_class(player, random() / 2 + 0.5)
-    Narrator().add([player.name, 'builds', 'a', trap.name, f'at {player.current_area}'])
+    trap = trap_class(player, player.rng.random() / 2 + 0.5)
+    player.narrator.add([player.name, 'builds', 'a', trap.name, f'at {player.current_area}'])
 
 
 def can_build_any_trap(player) -> bool:
@@ -1,4 +1,4 @@
-from random import random
+from random import Random
 
 from thirst_games.constants import AXE, KNIFE, SWORD, TRIDENT, SPEAR, CLUB, HATCHET, MACE, MACHETE
 
@@ -33,9 +33,9 @@ weapon_wound_proba = {
 }
 
 
-def get_weapon_wound(weapon_name):
+def get_weapon_wound(weapon_name, rng: Random):
     weapon_proba = weapon_wound_proba.get(weapon_name, weapon_wound_proba['default'])
-    r = random()
+    r = rng.random()
     for element, proba in weapon_proba:
         if r < proba:
             return element
@@ -58,7 +58,7 @@ weapon_bleed_proba = {
 }
 
 
-def get_weapon_blood(weapon_name):
+def get_weapon_blood(weapon_name, rng: Random):
     weapon_proba = weapon_bleed_proba.get(weapon_name, weapon_bleed_proba['default'])
-    r = random()
+    r = rng.random()
     return r < weapon_proba
@@ -0,0 +1,57 @@
+from random import Random
+from typing import Optional, TextIO
+
+from thirst_games.alliances import Alliances
+from thirst_games.context import Context
+from thirst_games.event_log import EventLog
+from thirst_games.map import Map
+from thirst_games.narrator import EVERY_LINE, Narrator, SilentNarrator
+from thirst_games.player.policy import HeuristicPolicy, Policy
+from thirst_games.player.scoring import ScoringEngine
+from thirst_games.profiler import Profiler
+from thirst_games.relationships import Relationships
+
+
+def child_seed(seed: int, key) -> int:
+    # string seeding is hashed with sha512, so child streams don't depend on PYTHONHASHSEED or on spawn order
+    return Random(f'{seed}/{key}').getrandbits(64)
+
+
+class World:
+    # everything a single game shares: several worlds can live side by side in the same process
+    def __init__(
+            self, seed: Optional[int]=None, headless=False, vectorized=False, profile=False,
+            output: Optional[TextIO]=None, flush_every=EVERY_LINE, record=False,
+    ) -> None:
+        if seed is None:
+            seed = Random().getrandbits(64)
+        self.seed = seed
+        self.rng = Random(seed)
+        self.context = Context()
+        self.alliances = Alliances()
+        # the narrator picks words from its own stream so that telling the story never changes the story
+        narrator_class = SilentNarrator if headless else Narrator
+        self.log = EventLog(self.context) if record else None  # typed events, needed to archive the game
+        # the told story goes to output (sys.stdout by default), written every line, phase or day
+        self.narrator = narrator_class(Random(child_seed(seed, 'narrator')), self.log, output, flush_every)
+        self.map: Map = None
+        self.relationships: Relationships = None
+        # chooses what the thinkers do: any Policy can be plugged in here, the vectorized engine
+        # scores all the players at once instead of judging the preferences one player at a time
+        self.policy: Policy = ScoringEngine(self, child_seed(seed, 'scoring')) if vectorized else HeuristicPolicy()
+        self.profiler = Profiler() if profile else None  # Game.run logs its report (INFO) when the game is over
+
+    @property
+    def headless(self) -> bool:
+        return not self.narrator.active
+
+    @property
+    def vectorized(self) -> bool:
+        return isinstance(self.policy, ScoringEngine)
+
+    def spawn(self, index: int) -> 'World':
+        return World(
+            child_seed(self.seed, index), headless=self.headless, vectorized=self.vectorized,
+            profile=self.profiler is not None, output=self.narrator.sink, flush_every=self.narrator.flush_every,
+            record=self.log is not None,
+        )